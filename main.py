@@ -6,12 +6,23 @@ A bullet-heaven style game built with Pygame
 import pygame
 import sys
 from src.game_engine import Game
-from src.config import WindowConfig
+from src.config import WindowConfig, FPS
 
 
 def main():
     """Initialize and run the game"""
     pygame.init()
+    # Only queue the events the game actually reacts to (drop the rest in SDL)
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(
+        [
+            pygame.QUIT,
+            pygame.KEYDOWN,
+            pygame.KEYUP,
+            pygame.MOUSEBUTTONDOWN,
+            pygame.MOUSEMOTION,
+        ]
+    )
     # Hide mouse cursor (we have custom crosshair)
     pygame.mouse.set_visible(False)
     # Create the game window
@@ -24,20 +35,38 @@ def main():
     # Main game loop
     clock = pygame.time.Clock()
 
+    # Per-frame callables bound once (fast local lookups in the loop)
+    tick = clock.tick
+    fps = FPS
+    pump_events = pygame.event.pump
+    peek_events = pygame.event.peek
+    get_events = pygame.event.get
+    flip = pygame.display.flip
+    update_display = pygame.display.update
+    QUIT = pygame.QUIT
+    handle_event = game.handle_event
+    update = game.update
+    render = game.render
+
     while game.running:
-        dt = clock.tick(WindowConfig.FPS) / 1000.0
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                game.running = False
-            game.handle_event(event)
+        dt = tick(fps) / 1000.0
+        # Handle events (pump once, skip dispatch when the queue is empty)
+        pump_events()
+        if get_events(QUIT, False):
+            game.running = False
+        if peek_events(None, False):
+            for event in get_events(None, False):
+                handle_event(event)
 
         # Update game state
-        game.update(dt)
+        update(dt)
 
-        # Render
-        game.render()
-        pygame.display.flip()
+        # Render and present (only the dirty rects when the renderer reports any)
+        dirty_rects = render()
+        if dirty_rects is None:
+            flip()
+        elif dirty_rects:
+            update_display(dirty_rects)
 
     pygame.quit()
     sys.exit()
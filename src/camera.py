@@ -9,6 +9,27 @@ import pygame
 class Camera:
     """Camera that follows an entity with screen shake support"""
 
+    # Fixed attribute layout (no per-instance __dict__ lookups)
+    __slots__ = (
+        "width",
+        "height",
+        "offset",
+        "shake_offset",
+        "visible_rect",
+        "_half_w",
+        "_half_h",
+        "_off_x",
+        "_off_y",
+        "_tx",
+        "_ty",
+        "_left",
+        "_top",
+        "_right",
+        "_bottom",
+        "_last_target",
+        "_last_shake",
+    )
+
     def __init__(self, width, height):
         """
         Initialize camera
@@ -22,6 +43,29 @@ class Camera:
         self.offset = pygame.math.Vector2(0, 0)
         self.shake_offset = (0, 0)
 
+        # Half-size precomputed (no division in update)
+        self._half_w = width // 2
+        self._half_h = height // 2
+
+        # Offset as plain floats (self.offset mirrors these for readers)
+        self._off_x = 0.0
+        self._off_y = 0.0
+
+        # Cached world->screen translation (offset + shake), refreshed on change
+        self._tx = 0.0
+        self._ty = 0.0
+
+        # Visible world-space bounds (refreshed with the translation)
+        self._left = 0.0
+        self._top = 0.0
+        self._right = float(width)
+        self._bottom = float(height)
+        self.visible_rect = pygame.Rect(0, 0, width, height)
+
+        # Last inputs seen by update() (dirty checking)
+        self._last_target = (None, None)
+        self._last_shake = (0, 0)
+
     def update(self, target, shake_offset=(0, 0)):
         """
         Update camera to follow target with optional shake
@@ -30,12 +74,79 @@ class Camera:
             target: Entity to follow (usually player)
             shake_offset: (x, y) tuple for screen shake offset
         """
+        position = target.position
+        target_pos = (position.x, position.y)
+
+        # Nothing moved and no shake change - cached translation still valid
+        if target_pos == self._last_target and shake_offset == self._last_shake:
+            return
+
+        self._last_target = target_pos
+        self._last_shake = shake_offset
+
         # ✅ Store shake offset
         self.shake_offset = shake_offset
 
-        # Center camera on target
-        self.offset.x = target.position.x - self.width // 2
-        self.offset.y = target.position.y - self.height // 2
+        # Center camera on target (raw float math, no Vector2 arithmetic)
+        off_x = target_pos[0] - self._half_w
+        off_y = target_pos[1] - self._half_h
+        self._off_x = off_x
+        self._off_y = off_y
+        self.offset.update(off_x, off_y)
+
+        # Recompute translation only when dirty (apply() is then two adds)
+        self._tx = shake_offset[0] - off_x
+        self._ty = shake_offset[1] - off_y
+
+        # World-space view bounds (shake included) for cheap culling
+        self._left = -self._tx
+        self._top = -self._ty
+        self._right = self._left + self.width
+        self._bottom = self._top + self.height
+        self.visible_rect.topleft = (self._left, self._top)
+
+    def is_visible(self, x, y, radius=0):
+        """
+        Check if a world-space point (or circle) is on screen
+
+        Args:
+            x: World x position
+            y: World y position
+            radius: Extra margin around the point (entity size)
+
+        Returns:
+            bool: True if any part of the circle may be visible
+        """
+        return (
+            self._left - radius <= x <= self._right + radius
+            and self._top - radius <= y <= self._bottom + radius
+        )
+
+    def get_cull_bounds(self, margin=0):
+        """
+        Get world-space view bounds grown by a margin, for inlined culling
+
+        Args:
+            margin: Extra margin on every side
+
+        Returns:
+            tuple: (left, top, right, bottom)
+        """
+        return (
+            self._left - margin,
+            self._top - margin,
+            self._right + margin,
+            self._bottom + margin,
+        )
+
+    def get_translation(self):
+        """
+        Get the world -> screen translation, for inlined transforms in loops
+
+        Returns:
+            tuple: (tx, ty) so that screen = world + (tx, ty), shake included
+        """
+        return self._tx, self._ty
 
     def apply(self, entity_position):
         """
@@ -45,12 +156,39 @@ class Camera:
             entity_position: Vector2 world position
 
         Returns:
-            Vector2: Screen position with shake applied
+            tuple: (x, y) screen position with shake applied
         """
-        return pygame.math.Vector2(
-            entity_position.x - self.offset.x + self.shake_offset[0],
-            entity_position.y - self.offset.y + self.shake_offset[1],
-        )
+        return (entity_position.x + self._tx, entity_position.y + self._ty)
+
+    def apply_batch(self, xs, ys):
+        """
+        Convert many world positions to screen positions in one call
+
+        Args:
+            xs: Sequence of world x positions
+            ys: Sequence of world y positions
+
+        Returns:
+            tuple: (screen_xs, screen_ys) lists with shake applied
+        """
+        tx = self._tx
+        ty = self._ty
+        return [x + tx for x in xs], [y + ty for y in ys]
+
+    def apply_into(self, entity_position, out):
+        """
+        Convert world position to screen position in place (no allocation)
+
+        Args:
+            entity_position: Vector2 world position
+            out: Preallocated Vector2 that receives the screen position
+
+        Returns:
+            Vector2: The same ``out`` vector
+        """
+        out.x = entity_position.x + self._tx
+        out.y = entity_position.y + self._ty
+        return out
 
     def apply_rect(self, rect):
         """
@@ -62,6 +200,4 @@ class Camera:
         Returns:
             pygame.Rect: Rect in screen coordinates
         """
-        return rect.move(
-            -self.offset.x + self.shake_offset[0], -self.offset.y + self.shake_offset[1]
-        )
+        return rect.move(self._tx, self._ty)
@@ -4,10 +4,10 @@ Centralized game configuration
 """
 
 # Common configs
-from .common import Colors, WindowConfig
+from .common import Colors, WindowConfig, FPS
 
 # Game config
-from .game import GameConfig
+from .game import GameConfig, CAMERA_SMOOTHING
 
 # Player config
 from .player import PlayerConfig
@@ -33,8 +33,10 @@ __all__ = [
     # Common
     "Colors",
     "WindowConfig",
+    "FPS",
     # Game
     "GameConfig",
+    "CAMERA_SMOOTHING",
     # Player
     "PlayerConfig",
     # Enemies
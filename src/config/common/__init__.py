@@ -3,7 +3,7 @@ Common Configuration
 Shared settings used across the entire game
 """
 
-from .window import WindowConfig
+from .window import WindowConfig, FPS
 from .colors import Colors
 
-__all__ = ["WindowConfig", "Colors"]
+__all__ = ["WindowConfig", "Colors", "FPS"]
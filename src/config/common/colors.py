@@ -40,3 +40,15 @@ class Colors:
 
     # Enemy Colors
     GOLD = (255, 215, 0)
+
+
+# Module-level aliases for hot paths (single global lookup per draw)
+BLACK = Colors.BLACK
+WHITE = Colors.WHITE
+RED = Colors.RED
+GREEN = Colors.GREEN
+BLUE = Colors.BLUE
+YELLOW = Colors.YELLOW
+CYAN = Colors.CYAN
+GRAY = Colors.GRAY
+GOLD = Colors.GOLD
@@ -2,6 +2,8 @@
 Window and Display Configuration
 """
 
+from typing import Final
+
 
 class WindowConfig:
     """Window and display settings"""
@@ -12,16 +14,8 @@ class WindowConfig:
     FPS = 60
     TITLE = "Vampire Survivors Clone"
 
-    # Colors
-    class Colors:
-        BLACK = (0, 0, 0)
-        WHITE = (255, 255, 255)
-        RED = (255, 0, 0)
-        GREEN = (0, 255, 0)
-        BLUE = (0, 0, 255)
-        YELLOW = (255, 255, 0)
-        PURPLE = (128, 0, 128)
-        GRAY = (128, 128, 128)
-        DARK_GRAY = (64, 64, 64)
-        ORANGE = (255, 165, 0)
-        CYAN = (0, 255, 255)
+
+# Module-level aliases for hot paths (single global lookup per frame)
+WIDTH: Final[int] = WindowConfig.WIDTH
+HEIGHT: Final[int] = WindowConfig.HEIGHT
+FPS: Final[int] = WindowConfig.FPS
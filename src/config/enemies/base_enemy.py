@@ -19,7 +19,15 @@ class BaseEnemyConfig:
     # Appearance
     COLOR = Colors.RED
 
+    # Collision (derived from SIZE, recomputed for each subclass)
+    RADIUS = SIZE // 2
+
+    def __init_subclass__(cls, **kwargs):
+        """Derive RADIUS once for subclasses that override SIZE"""
+        super().__init_subclass__(**kwargs)
+        cls.RADIUS = cls.SIZE // 2
+
     @classmethod
     def get_radius(cls):
         """Get enemy collision radius"""
-        return cls.SIZE // 2
+        return cls.RADIUS
@@ -16,8 +16,3 @@ class EliteEnemyConfig(BaseEnemyConfig):
     DAMAGE = 15
     XP_VALUE = 20
     COLOR = Colors.PURPLE
-
-    # Visual
-    color = (255, 215, 0)  # Gold
-    size = 35
-    radius = size // 2
@@ -3,8 +3,10 @@ Fast Enemy Configuration
 Fast, low health enemy with circling and dash behavior
 """
 
+from .base_enemy import BaseEnemyConfig
 
-class FastEnemyConfig:
+
+class FastEnemyConfig(BaseEnemyConfig):
     """Fast enemy configuration"""
 
     # Stats
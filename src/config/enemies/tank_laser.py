@@ -4,6 +4,7 @@ Parameters for Tank enemy laser attacks
 """
 
 from src.config.projectiles import BaseProjectileConfig
+from src.config.common.colors import Colors
 
 
 class TankLaserConfig(BaseProjectileConfig):
@@ -23,5 +24,5 @@ class TankLaserConfig(BaseProjectileConfig):
     # Visual
     LASER_LENGTH = 15  # pixels
     LASER_WIDTH = 4  # pixels
-    LASER_COLOR = (255, 0, 0)  # Red (enemy laser)
+    LASER_COLOR = Colors.RED  # Red (enemy laser)
     LASER_GLOW_COLOR = (255, 100, 100)  # Light red glow
@@ -3,12 +3,15 @@ General Game Configuration
 Game mechanics and systems
 """
 
+from typing import Final
+
 
 class GameConfig:
     """General game settings"""
 
     # Camera
     CAMERA_SMOOTHING = 0.1
+    CULL_MARGIN = 32  # Extra pixels kept around the screen (sprites, health bars)
 
     # Pickup and interaction
     PICKUP_RANGE = 50
@@ -17,3 +20,9 @@ class GameConfig:
     BASE_XP_REQUIRED = 10
     XP_MULTIPLIER = 1.5
     MAX_LEVEL = 100
+
+
+# Module-level aliases for hot paths (single global lookup per frame)
+CAMERA_SMOOTHING: Final[float] = GameConfig.CAMERA_SMOOTHING
+CULL_MARGIN: Final[int] = GameConfig.CULL_MARGIN
+PICKUP_RANGE: Final[int] = GameConfig.PICKUP_RANGE
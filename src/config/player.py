@@ -18,8 +18,10 @@ class PlayerConfig:
     # Appearance
     COLOR = Colors.BLUE
 
-    # Collision
+    # Collision (precomputed, no division per call)
+    RADIUS = SIZE // 2
+
     @classmethod
     def get_radius(cls):
         """Get player collision radius"""
-        return cls.SIZE // 2
+        return cls.RADIUS
@@ -28,3 +28,13 @@ class SpawnManagerConfig:
     FAST_ENEMY_CHANCE = 0.18  # 18%
     TANK_ENEMY_CHANCE = 0.07  # 7%
     ELITE_ENEMY_CHANCE = 0.05  # 5%
+
+
+# Cumulative thresholds for the enemy-type roll (basic, fast, tank; else elite)
+SpawnManagerConfig.ENEMY_TYPE_CDF = (
+    SpawnManagerConfig.BASIC_ENEMY_CHANCE,
+    SpawnManagerConfig.BASIC_ENEMY_CHANCE + SpawnManagerConfig.FAST_ENEMY_CHANCE,
+    SpawnManagerConfig.BASIC_ENEMY_CHANCE
+    + SpawnManagerConfig.FAST_ENEMY_CHANCE
+    + SpawnManagerConfig.TANK_ENEMY_CHANCE,
+)
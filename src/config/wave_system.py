@@ -35,3 +35,39 @@ class WaveConfig:
     BASE_SPAWN_RATE = 2.0  # Wave 1
     SPAWN_RATE_INCREASE = 0.2  # Per wave
     MAX_SPAWN_RATE = 15.0  # Cap
+
+    # Dense per-wave lookup (filled below the class)
+    COMPOSITION_TABLE_SIZE = 101  # Waves 0..100; later waves reuse the last entry
+    COMPOSITION_TABLE = ()
+
+
+def _resolve_composition(wave):
+    """
+    Resolve the composition for a wave (closest defined wave at or below it)
+
+    Args:
+        wave: Wave number
+
+    Returns:
+        tuple: (enemy type names, cumulative weights)
+    """
+    composition = WaveConfig.DEFAULT_COMPOSITION
+    for wave_num in sorted(WaveConfig.WAVE_COMPOSITION.keys(), reverse=True):
+        if wave >= wave_num:
+            composition = WaveConfig.WAVE_COMPOSITION[wave_num]
+            break
+
+    types = []
+    cdf = []
+    cumulative = 0.0
+    for enemy_type, weight in composition.items():
+        cumulative += weight
+        types.append(enemy_type)
+        cdf.append(cumulative)
+    return tuple(types), tuple(cdf)
+
+
+# Walk the sparse dict once at import, spawn lookups become a tuple index
+WaveConfig.COMPOSITION_TABLE = tuple(
+    _resolve_composition(wave) for wave in range(WaveConfig.COMPOSITION_TABLE_SIZE)
+)
@@ -3,6 +3,8 @@ Bomb Configuration
 Parameters for bomb weapon
 """
 
+from ..common import Colors
+
 
 class BombConfig:
     """Bomb weapon configuration"""
@@ -22,7 +24,7 @@ class BombConfig:
     # Visual
     BOMB_SIZE = 8  # bomb sprite radius
     BOMB_COLOR = (150, 150, 150)
-    WARNING_COLOR = (255, 0, 0)  # red
+    WARNING_COLOR = Colors.RED
     PULSE_SPEED = 8.0  # warning circle pulse speed
 
     # Placement cooldown
@@ -12,6 +12,7 @@ class ChainLaserConfig:
     COOLDOWN = 0.1  # How often it can switch targets
     DAMAGE_PER_SECOND = 50  # DOT damage
     RANGE = 300  # Maximum lock-on range
+    RANGE_SQ = RANGE * RANGE  # Squared range for sqrt-free tests
     AUTO_AIM = True  # Automatically targets nearest enemy
 
     # Beam visual properties
@@ -23,6 +24,7 @@ class ChainLaserConfig:
     # Chain properties (unlocked at level 2+)
     CHAIN_ENABLED_AT_LEVEL = 2  # Enable chaining at level 2
     CHAIN_RANGE = 150  # How far it can jump to next enemy
+    CHAIN_RANGE_SQ = CHAIN_RANGE * CHAIN_RANGE
     MAX_CHAIN_COUNT_BY_LEVEL = {
         1: 0,  # No chaining at level 1
         2: 1,  # Can chain to 1 additional enemy
@@ -46,18 +48,38 @@ class ChainLaserConfig:
         8: 3.0,
     }
 
+    # Per-level lookup tables indexed by level (filled below the class)
+    MAX_LEVEL = 8
+    _DPS_BY_LEVEL = ()
+    _MAX_CHAINS_BY_LEVEL = ()
+
     @classmethod
     def get_max_chains(cls, level):
         """Get maximum chain count for weapon level"""
-        return cls.MAX_CHAIN_COUNT_BY_LEVEL.get(level, 0)
+        if 0 <= level <= cls.MAX_LEVEL:
+            return cls._MAX_CHAINS_BY_LEVEL[level]
+        return 0
 
     @classmethod
     def get_damage_per_second(cls, level):
         """Get DPS for weapon level"""
-        multiplier = cls.DAMAGE_MULTIPLIER_BY_LEVEL.get(level, 1.0)
-        return cls.DAMAGE_PER_SECOND * multiplier
+        if 0 <= level <= cls.MAX_LEVEL:
+            return cls._DPS_BY_LEVEL[level]
+        return cls.DAMAGE_PER_SECOND * 1.0
 
     @classmethod
     def can_chain(cls, level):
         """Check if weapon can chain at this level"""
         return level >= cls.CHAIN_ENABLED_AT_LEVEL
+
+
+# Resolve the per-level dicts once (getters become a tuple index)
+ChainLaserConfig._DPS_BY_LEVEL = tuple(
+    ChainLaserConfig.DAMAGE_PER_SECOND
+    * ChainLaserConfig.DAMAGE_MULTIPLIER_BY_LEVEL.get(level, 1.0)
+    for level in range(ChainLaserConfig.MAX_LEVEL + 1)
+)
+ChainLaserConfig._MAX_CHAINS_BY_LEVEL = tuple(
+    ChainLaserConfig.MAX_CHAIN_COUNT_BY_LEVEL.get(level, 0)
+    for level in range(ChainLaserConfig.MAX_LEVEL + 1)
+)
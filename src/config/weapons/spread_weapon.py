@@ -4,6 +4,7 @@ Parameters for player spread shot weapon
 """
 
 from src.config.projectiles import BaseProjectileConfig
+from src.config.common.colors import Colors
 
 
 class SpreadWeaponConfig(BaseProjectileConfig):
@@ -21,10 +22,10 @@ class SpreadWeaponConfig(BaseProjectileConfig):
     PROJECTILE_SIZE = 3  # radius in pixels
 
     # Visual
-    PROJECTILE_COLOR = (255, 215, 0)  # Gold/yellow
+    PROJECTILE_COLOR = Colors.GOLD  # Gold/yellow
     PROJECTILE_GLOW_COLOR = (255, 240, 150)  # Light yellow glow
 
     # Crosshair
     CROSSHAIR_SIZE = 15  # pixels
-    CROSSHAIR_COLOR = (255, 215, 0)  # Gold to match projectiles
+    CROSSHAIR_COLOR = Colors.GOLD  # Gold to match projectiles
     CROSSHAIR_THICKNESS = 2  # line width
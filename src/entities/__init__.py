@@ -1,46 +1,32 @@
 """
 Game Entities
 All game entities (player, enemies, projectiles, weapons, etc.)
-"""
-
-from .player import Player
-from .pickups import XPOrb  # ✅ Changed from .xp_orb
-
-# Import all enemies from enemies subdirectory
-from .enemies import (
-    Enemy,
-    BasicEnemy,
-    FastEnemy,
-    TankEnemy,
-    EliteEnemy,
-)
 
-# Import all projectiles from projectiles subdirectory
-from .projectiles import (
-    BaseProjectile,
-    BasicProjectile,
-)
+Submodules are loaded lazily on first attribute access (PEP 562), so
+importing one entity does not pull in every enemy, projectile and weapon.
+"""
 
-# Import all weapons from weapons subdirectory
-from .weapons import (
-    BaseWeapon,
-    BasicWeapon,
-)
+from src.lazy_loader import lazy_exports
 
-__all__ = [
+# Public name -> submodule (relative to this package) that defines it
+_LAZY = {
     # Core entities
-    "Player",
-    "XPOrb",
+    "Player": ".player",
+    "XPOrb": ".pickups.xp_orb",
     # Enemies
-    "Enemy",
-    "BasicEnemy",
-    "FastEnemy",
-    "TankEnemy",
-    "EliteEnemy",
+    "Enemy": ".enemies.base_enemy",
+    "BasicEnemy": ".enemies.basic_enemy",
+    "FastEnemy": ".enemies.fast_enemy",
+    "TankEnemy": ".enemies.tank_enemy",
+    "EliteEnemy": ".enemies.elite_enemy",
     # Projectiles
-    "BaseProjectile",
-    "BasicProjectile",
+    "BaseProjectile": ".projectiles.base_projectile",
+    "BasicProjectile": ".projectiles.basic_projectile",
     # Weapons
-    "BaseWeapon",
-    "BasicWeapon",
-]
+    "BaseWeapon": ".weapons.base_weapon",
+    "BasicWeapon": ".weapons.basic_weapon",
+}
+
+__all__ = list(_LAZY)
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
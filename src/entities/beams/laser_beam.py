@@ -9,6 +9,20 @@ import pygame
 class LaserBeam:
     """Represents an active laser beam"""
 
+    # Fixed attribute layout (no per-instance __dict__)
+    __slots__ = (
+        "start_pos",
+        "end_pos",
+        "damage_per_second",
+        "color",
+        "width",
+        "lifetime",
+        "age",
+    )
+
+    # Shared screen-sized glow layer (allocated once, cleared per beam bbox)
+    _glow_surface = None
+
     def __init__(
         self, start_pos, end_pos, damage_per_second, color=(255, 0, 0), width=3
     ):
@@ -50,8 +64,8 @@ class LaserBeam:
             camera: Camera for world-to-screen conversion
         """
         # Convert to screen coordinates
-        start_screen = camera.apply(self.start_pos)
-        end_screen = camera.apply(self.end_pos)
+        start_screen_x, start_screen_y = camera.apply(self.start_pos)
+        end_screen_x, end_screen_y = camera.apply(self.end_pos)
 
         # Calculate alpha based on age (fade out)
         alpha = int(255 * (1.0 - self.age / self.lifetime))
@@ -59,22 +73,31 @@ class LaserBeam:
         # Draw main beam
         # color_with_alpha = (*self.color, alpha)
 
-        # Draw glow (thicker, semi-transparent)
-        glow_surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        pygame.draw.line(
-            glow_surface,
-            (*self.color, alpha // 3),
-            (int(start_screen.x), int(start_screen.y)),
-            (int(end_screen.x), int(end_screen.y)),
-            self.width * 3,
-        )
-        screen.blit(glow_surface, (0, 0))
+        start = (int(start_screen_x), int(start_screen_y))
+        end = (int(end_screen_x), int(end_screen_y))
+        glow_width = self.width * 3
+
+        # Reuse the glow layer; only resize when the screen size changes
+        glow_surface = LaserBeam._glow_surface
+        if glow_surface is None or glow_surface.get_size() != screen.get_size():
+            glow_surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+            LaserBeam._glow_surface = glow_surface
+
+        # Bounding box of the glow line, clipped to the screen
+        bbox = pygame.Rect(
+            min(start[0], end[0]) - glow_width,
+            min(start[1], end[1]) - glow_width,
+            abs(end[0] - start[0]) + glow_width * 2,
+            abs(end[1] - start[1]) + glow_width * 2,
+        ).clip(glow_surface.get_rect())
+
+        # Draw glow (thicker, semi-transparent) - clear/blit only the bbox
+        if bbox.width and bbox.height:
+            glow_surface.fill((0, 0, 0, 0), bbox)
+            pygame.draw.line(
+                glow_surface, (*self.color, alpha // 3), start, end, glow_width
+            )
+            screen.blit(glow_surface, bbox.topleft, bbox)
 
         # Draw core beam (brighter)
-        pygame.draw.line(
-            screen,
-            self.color,
-            (int(start_screen.x), int(start_screen.y)),
-            (int(end_screen.x), int(end_screen.y)),
-            self.width,
-        )
+        pygame.draw.line(screen, self.color, start, end, self.width)
@@ -1,18 +1,19 @@
 """
 Enemy Entities
-All enemy types and base enemy class
+All enemy types and base enemy class (loaded lazily)
 """
 
-from .base_enemy import Enemy
-from .basic_enemy import BasicEnemy
-from .fast_enemy import FastEnemy
-from .tank_enemy import TankEnemy
-from .elite_enemy import EliteEnemy
+from src.lazy_loader import lazy_exports
 
-__all__ = [
-    "Enemy",
-    "BasicEnemy",
-    "FastEnemy",
-    "TankEnemy",
-    "EliteEnemy",
-]
+# Public name -> submodule (relative to this package) that defines it
+_LAZY = {
+    "Enemy": ".base_enemy",
+    "BasicEnemy": ".basic_enemy",
+    "FastEnemy": ".fast_enemy",
+    "TankEnemy": ".tank_enemy",
+    "EliteEnemy": ".elite_enemy",
+}
+
+__all__ = list(_LAZY)
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
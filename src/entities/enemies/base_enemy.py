@@ -7,6 +7,65 @@ import math
 import pygame
 from typing import Optional, List
 from src.systems.enemy_animation import EnemyAnimationConfig
+from src.systems.enemy_steering import step_chasers
+from src.rendering.surface_cache import get_circle_surface
+from src.config.common.colors import RED, GREEN
+
+
+def _collide_rect(enemy, other):
+    """Rect overlap test for entities that have a rect"""
+    return enemy.rect.colliderect(other.rect)
+
+
+def _collide_never(enemy, other):
+    """Entities without a rect never collide"""
+    return False
+
+
+# type(other) -> collision test, filled lazily by Enemy.collides_with
+_COLLIDE_DISPATCH = {}
+
+# Shared by every enemy without a collision offset (immutable, built once)
+NO_COLLISION_OFFSET = (0.0, 0.0)
+
+# tuple(sprite paths) -> decoded frames / pre-rotated LUT, shared by every
+# enemy class using the same art
+_SPRITE_CACHE = {}
+_ROTATION_CACHE = {}
+
+
+def _decode_frames(paths):
+    """Load and convert sprite frames (red square fallback per failed path)"""
+    frames = []
+    for path in paths:
+        try:
+            sprite = pygame.image.load(path).convert_alpha()
+        except pygame.error as e:
+            print(f"⚠️ Failed to load {path}: {e}")
+            # Fallback: red square (with alpha, so premul_alpha() accepts it)
+            sprite = pygame.Surface((24, 24), pygame.SRCALPHA)
+            sprite.fill((255, 0, 0))
+        frames.append(sprite)
+    return frames
+
+
+def _rotate_frames(frames, buckets, step):
+    """
+    Pre-rotate every frame into all angle buckets (no rotate at render)
+    Stored premultiplied: BLEND_PREMULTIPLIED blits are cheaper
+
+    Returns:
+        list: [frame_index][bucket] -> (surface, half_w, half_h)
+    """
+    rotated_frames = []
+    for frame in frames:
+        rotations = []
+        for bucket in range(buckets):
+            rotated = pygame.transform.rotate(frame, -bucket * step).premul_alpha()
+            width, height = rotated.get_size()
+            rotations.append((rotated, width // 2, height // 2))
+        rotated_frames.append(rotations)
+    return rotated_frames
 
 
 class Enemy(pygame.sprite.Sprite):
@@ -16,37 +75,118 @@ class Enemy(pygame.sprite.Sprite):
     - Animation state per instance (correct timing!)
     """
 
+    # Hot per-instance state in slots (Sprite still provides a __dict__
+    # for the extra attributes subclasses add)
+    __slots__ = (
+        "position",
+        "velocity",
+        "max_health",
+        "health",
+        "_inv_max_health",
+        "speed",
+        "contact_damage",
+        "xp_value",
+        "size",
+        "color",
+        "radius",
+        "_rect",
+        "_half_w",
+        "_half_h",
+        "collision_shape",
+        "collision_radius",
+        "collision_offset",
+        "is_dead",
+        "_anim_epoch",
+        "use_sprite",
+        "current_sprite",
+        "last_angle",
+        "show_collision_debug",
+    )
+
     # CLASS VARIABLES - Sprite frames shared by all instances
     _sprite_frames: Optional[List[pygame.Surface]] = None
     _sprite_paths = EnemyAnimationConfig.BASE_ENEMY_FRAMES
     _frame_duration = EnemyAnimationConfig.FRAME_DURATION
+    _rotated_frames = None  # [frame_index][bucket] -> (surface, half_w, half_h)
+    _frame_count = 1
+
+    # Shared animation clock, advanced once per frame by tick_animation()
+    animation_clock = 0.0
+
+    # Sprite rotation quantization (power of two -> bucket wraps with a mask)
+    ROTATION_BUCKETS = 256
+    ROTATION_MASK = ROTATION_BUCKETS - 1
+    ROTATION_STEP = 360 / ROTATION_BUCKETS
+    BUCKETS_PER_RADIAN = ROTATION_BUCKETS / math.tau
+    # Sprites face up (atan2 0 is right): quarter turn, plus a full turn so
+    # int() always floors a positive value, plus 0.5 to round to nearest
+    BUCKET_OFFSET = ROTATION_BUCKETS // 4 + ROTATION_BUCKETS + 0.5
+
+    # Health bar layout
+    HEALTH_BAR_WIDTH = 30
+    HEALTH_BAR_HEIGHT = 4
+
+    # Action flags polled by the game engine every frame (plain reads, no
+    # hasattr); enemies that shoot/explode set them on the instance
+    ready_to_shoot = False
+    ready_to_explode = False
+
+    # True when the class keeps the base chase update (batch-steerable)
+    batch_steering = True
+    # True when the class keeps the base render (body goes through one blits())
+    batch_render = True
+
+    def __init_subclass__(cls, **kwargs):
+        """Flag subclasses with custom update()/render() as not batchable"""
+        super().__init_subclass__(**kwargs)
+        cls.batch_steering = cls.update is Enemy.update
+        cls.batch_render = cls.render is Enemy.render
 
     @classmethod
     def _load_sprites(cls):
-        """Load sprite frames for this class (once per class)"""
-        if cls._sprite_frames is None:
-            cls._sprite_frames = []
-
-            for path in cls._sprite_paths:
-                try:
-                    sprite = pygame.image.load(path).convert_alpha()
-                    cls._sprite_frames.append(sprite)
-                except pygame.error as e:
-                    print(f"⚠️ Failed to load {path}: {e}")
-                    # Fallback: red square
-                    sprite = pygame.Surface((24, 24))
-                    sprite.fill((255, 0, 0))
-                    cls._sprite_frames.append(sprite)
-
-            if cls._sprite_frames:
-                print(f"{cls.__name__}: Loaded {len(cls._sprite_frames)} sprite frames")
+        """Load sprite frames for this class (once per class, shared by paths)"""
+        if cls.__dict__.get("_sprite_frames") is None:
+            key = tuple(cls._sprite_paths)
+            frames = _SPRITE_CACHE.get(key)
+            if frames is None:
+                frames = _SPRITE_CACHE[key] = _decode_frames(key)
+                if frames:
+                    print(f"{cls.__name__}: Loaded {len(frames)} sprite frames")
+            cls._sprite_frames = frames
+            cls._frame_count = max(1, len(frames))
+
+            # Classes with their own render() never draw the rotation LUT
+            if cls.batch_render:
+                rotated = _ROTATION_CACHE.get(key)
+                if rotated is None:
+                    rotated = _ROTATION_CACHE[key] = _rotate_frames(
+                        frames, cls.ROTATION_BUCKETS, cls.ROTATION_STEP
+                    )
+                cls._rotated_frames = rotated
+            else:
+                cls._rotated_frames = []
+
+    @staticmethod
+    def tick_animation(dt):
+        """Advance the shared animation clock (once per frame for all enemies)"""
+        Enemy.animation_clock += dt
+
+    @classmethod
+    def preload_sprites(cls):
+        """
+        Load and pre-rotate this class's sprites (call once at load time,
+        before the first instance is created - __init__ no longer loads)
+        """
+        cls._load_sprites()
 
     def __init__(self, x, y, config, collision_config=None):
         """Initialize enemy instance"""
         super().__init__()
 
-        # Load class sprites on first instance creation
-        self._load_sprites()
+        # Sprites are loaded at load time (preload_sprites), never mid-game
+        assert (
+            type(self).__dict__.get("_sprite_frames") is not None
+        ), f"{type(self).__name__}.preload_sprites() must run before spawning"
 
         # Position and movement
         self.position = pygame.math.Vector2(x, y)
@@ -55,28 +195,31 @@ class Enemy(pygame.sprite.Sprite):
         # Stats from config
         self.max_health = config.HEALTH
         self.health = self.max_health
+        self._inv_max_health = 1.0 / self.max_health  # Multiply, don't divide
         self.speed = config.SPEED
         self.contact_damage = config.CONTACT_DAMAGE
         self.xp_value = config.XP_VALUE
         self.size = config.SIZE
         self.color = config.COLOR
-        self.radius = config.SIZE // 2
+        self.radius = config.RADIUS
 
-        # Collision
-        self.rect = pygame.Rect(0, 0, self.size, self.size)
-        self.rect.center = (int(self.position.x), int(self.position.y))
+        # Collision rect, synced from position only when read (see rect)
+        self._half_w = self.size // 2
+        self._half_h = self.size // 2
+        self._rect = pygame.Rect(
+            int(x) - self._half_w, int(y) - self._half_h, self.size, self.size
+        )
 
         # Collision setup
         self.collision_shape = "circle"
         self.collision_radius = self.radius
-        self.collision_offset = pygame.math.Vector2(0, 0)
+        self.collision_offset = NO_COLLISION_OFFSET
 
         # State
         self.is_dead = False
 
-        # INSTANCE-LEVEL animation state (each enemy has its own!)
-        self.current_frame = 0
-        self.frame_time_accumulated = 0.0
+        # INSTANCE-LEVEL animation phase (each enemy starts at its own frame 0)
+        self._anim_epoch = Enemy.animation_clock
         self.use_sprite = len(self._sprite_frames) > 0 if self._sprite_frames else False
 
         # Performance
@@ -86,31 +229,49 @@ class Enemy(pygame.sprite.Sprite):
         # Debug
         self.show_collision_debug = False
 
-    def update(self, dt, player_position):
-        """Update enemy state"""
-        if self.is_dead:
-            return
+    @property
+    def rect(self):
+        """
+        Collision rect centred on the current position
 
-        # Calculate direction to player
-        direction = player_position - self.position
-        if direction.length() > 0:
-            direction = direction.normalize()
+        Movement only writes position; the rect is brought up to date here,
+        so enemies nobody rect-tests this frame cost nothing.
+        """
+        rect = self._rect
+        rect.x = int(self.position.x) - self._half_w
+        rect.y = int(self.position.y) - self._half_h
+        return rect
 
-        # Move towards player
-        self.velocity = direction * self.speed
-        self.position += self.velocity * dt
+    @rect.setter
+    def rect(self, value):
+        self._rect = value
 
-        # Update INSTANCE animation state (not shared!)
-        if self.use_sprite:
-            self.frame_time_accumulated += dt
-
-            # Advance frame when enough time has passed
-            if self.frame_time_accumulated >= self._frame_duration:
-                self.frame_time_accumulated -= self._frame_duration
-                self.current_frame = (self.current_frame + 1) % len(self._sprite_frames)
-
-        # Update collision
-        self.rect.center = (int(self.position.x), int(self.position.y))
+    def update(self, dt, player_position):
+        """Update enemy state (chase player; frames follow tick_animation)"""
+        step_chasers((self,), player_position.x, player_position.y, dt)
+
+    @property
+    def current_frame(self):
+        """Animation frame index, derived from the shared clock when read"""
+        elapsed = Enemy.animation_clock - self._anim_epoch
+        return int(elapsed / self._frame_duration) % self._frame_count
+
+    def get_rotated_frame(self, angle_deg):
+        """
+        Get current frame pre-rotated to the nearest angle bucket
+
+        Args:
+            angle_deg: Facing angle in degrees
+
+        Returns:
+            tuple: (rotated surface, half width, half height), built at load
+                   time (premultiplied alpha, blit with BLEND_PREMULTIPLIED)
+        """
+        bucket = (
+            int(angle_deg / self.ROTATION_STEP + self.ROTATION_BUCKETS + 0.5)
+            & self.ROTATION_MASK
+        )
+        return self._rotated_frames[self.current_frame][bucket]
 
     def get_current_frame(self) -> pygame.Surface:
         """Get current animation frame from CLASS sprites"""
@@ -119,93 +280,77 @@ class Enemy(pygame.sprite.Sprite):
         return None
 
     def take_damage(self, damage):
-        """Take damage"""
-        self.health -= damage
-        if self.health <= 0:
-            self.health = 0
-            self.is_dead = True
-            return True
-        return False
+        """Take damage (returns True if this left the enemy dead)"""
+        self.health = max(0, self.health - damage)
+        self.is_dead = self.health == 0
+        return self.is_dead
 
     def get_xp_value(self):
         """Get XP value"""
         return self.xp_value
 
     def collides_with(self, other):
-        """Check collision"""
-        if hasattr(other, "rect"):
-            return self.rect.colliderect(other.rect)
-        return False
+        """Check collision (test resolved once per other type, then cached)"""
+        check = _COLLIDE_DISPATCH.get(type(other))
+        if check is None:
+            check = _collide_rect if hasattr(other, "rect") else _collide_never
+            _COLLIDE_DISPATCH[type(other)] = check
+        return check(self, other)
 
     def render(self, screen, camera, player_position):
         """Render enemy"""
-        screen_pos = camera.apply(self.position)
-
+        sx, sy = camera.apply(self.position)
+        screen.blit(*self.get_blit(sx, sy, player_position))
+        self.render_overlay(screen, sx, sy)
+
+    def get_blit(self, sx, sy, player_position):
+        """
+        Get the body surface and destination for a batched screen.blits()
+
+        Args:
+            sx: Screen x of the enemy centre
+            sy: Screen y of the enemy centre
+            player_position: Vector2 the sprite faces
+
+        Returns:
+            tuple: (surface, (x, y)[, area, flags]) - sprite frames are
+                   premultiplied and carry the BLEND_PREMULTIPLIED flag
+        """
         if self.use_sprite:
-            current_frame = self.get_current_frame()
-
-            if current_frame:
-                # Calculate angle to player
-                dx = player_position.x - self.position.x
-                dy = player_position.y - self.position.y
-                angle_deg = math.degrees(math.atan2(dy, dx)) + 90
-
-                # Rotate and draw
-                rotated = pygame.transform.rotate(current_frame, -angle_deg)
-                rect = rotated.get_rect(center=(int(screen_pos.x), int(screen_pos.y)))
-                screen.blit(rotated, rect)
-            else:
-                # Fallback to circle
-                pygame.draw.circle(
-                    screen, (255, 0, 0), (int(screen_pos.x), int(screen_pos.y)), 15
-                )
-        else:
-            pygame.draw.circle(
-                screen, self.color, (int(screen_pos.x), int(screen_pos.y)), 15
+            # Angle to player straight to a LUT bucket (radians, no degrees())
+            dx = player_position.x - self.position.x
+            dy = player_position.y - self.position.y
+            bucket = (
+                int(math.atan2(dy, dx) * self.BUCKETS_PER_RADIAN + self.BUCKET_OFFSET)
+                & self.ROTATION_MASK
             )
 
-        # Health bar
-        if hasattr(self, "max_health") and self.health < self.max_health:
-            self._render_health_bar(screen, screen_pos)
-
-    def _render_health_bar(self, screen, screen_pos):
-        """Render health bar"""
-        bar_width = 30
-        bar_height = 4
-        bar_x = screen_pos.x - bar_width / 2
-        bar_y = screen_pos.y - 25
-
-        pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, bar_width, bar_height))
-
-        health_ratio = max(0, self.health / self.max_health)
-        pygame.draw.rect(
-            screen, (0, 255, 0), (bar_x, bar_y, bar_width * health_ratio, bar_height)
-        )
-
-
-# ============================================
-# FAST ENEMY - FASTER ANIMATION
-# ============================================
-
-
-class FastEnemy(Enemy):
-    """Fast enemy with faster animation"""
-
-    # Own sprite frames
-    _sprite_frames: Optional[List[pygame.Surface]] = None
-    _sprite_paths = EnemyAnimationConfig.BASE_ENEMY_FRAMES
-    _frame_duration = EnemyAnimationConfig.FAST_ENEMY_FRAME_DURATION  # Faster!
+            # Pre-rotated frame, drawn centred
+            rotated, half_w, half_h = self._rotated_frames[self.current_frame][bucket]
+            return (
+                rotated,
+                (int(sx) - half_w, int(sy) - half_h),
+                None,
+                pygame.BLEND_PREMULTIPLIED,
+            )
 
+        return get_circle_surface(self.color, 15), (int(sx) - 15, int(sy) - 15)
 
-# ============================================
-# TANK ENEMY - SLOWER ANIMATION
-# ============================================
+    def render_overlay(self, screen, sx, sy):
+        """Draw what goes on top of the body (health bar when damaged)"""
+        if self.health < self.max_health:
+            self._render_health_bar(screen, sx, sy)
 
+    def _render_health_bar(
+        self, screen, sx, sy, red=RED, green=GREEN, draw_rect=pygame.draw.rect
+    ):
+        """Render health bar (colors/draw bound as fast locals)"""
+        bar_width = self.HEALTH_BAR_WIDTH
+        bar_height = self.HEALTH_BAR_HEIGHT
+        bar_x = sx - bar_width / 2
+        bar_y = sy - 25
 
-class TankEnemy(Enemy):
-    """Tank enemy with slower animation"""
+        draw_rect(screen, red, (bar_x, bar_y, bar_width, bar_height))
 
-    # Own sprite frames
-    _sprite_frames: Optional[List[pygame.Surface]] = None
-    _sprite_paths = EnemyAnimationConfig.BASE_ENEMY_FRAMES
-    _frame_duration = EnemyAnimationConfig.TANK_ENEMY_FRAME_DURATION  # Slower!
+        health_ratio = max(0, self.health * self._inv_max_health)
+        draw_rect(screen, green, (bar_x, bar_y, bar_width * health_ratio, bar_height))
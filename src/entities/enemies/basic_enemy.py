@@ -10,6 +10,8 @@ from src.config import BaseEnemyConfig
 class BasicEnemy(Enemy):
     """Basic enemy - balanced stats, most common enemy type"""
 
+    __slots__ = ()
+
     def __init__(self, x, y):
         """
         Initialize basic enemy
@@ -0,0 +1,170 @@
+"""
+Dash Behavior
+Shared cooldown -> telegraph (blink) -> dash state machine for dashing enemies
+"""
+
+import math
+import random
+
+
+class DashBehavior:
+    """
+    Mixin for enemies that telegraph and then dash at the player
+
+    Subclasses tune the class constants and may override the hooks
+    (_dash_ready, _get_dash_speed, _on_telegraph_start, _on_telegraph_end,
+    _on_dash_end); tick_dash() drives the whole state machine
+    """
+
+    # Empty so it can be mixed into slotted enemies; users slot DASH_SLOTS
+    __slots__ = ()
+
+    # Instance attributes set by _init_dash (for the user's __slots__)
+    DASH_SLOTS = (
+        "can_dash",
+        "is_telegraphing",
+        "telegraph_timer",
+        "is_dashing",
+        "dash_timer",
+        "dash_hit_player",
+        "dash_direction",
+        "dash_cooldown",
+        "visible",
+        "blink_timer",
+    )
+
+    # Tuning (overridden per enemy class)
+    DASH_COOLDOWN_MIN = 3.0  # seconds
+    DASH_COOLDOWN_MAX = 5.0  # seconds
+    DASH_DURATION = 1.0  # seconds
+    DASH_SPEED = 600  # pixels per second
+    TELEGRAPH_DURATION = 0.5  # seconds to blink before dash
+    BLINK_INTERVAL = 0.1  # seconds between visibility toggles
+
+    def _init_dash(self, can_dash=True):
+        """
+        Initialize dash state (call from __init__)
+
+        Args:
+            can_dash: Whether this enemy ever dashes
+        """
+        self.can_dash = can_dash
+        self.is_telegraphing = False
+        self.telegraph_timer = 0.0
+        self.is_dashing = False
+        self.dash_timer = 0.0
+        self.dash_hit_player = False
+        self.dash_direction = (0.0, 0.0)
+        self._reset_dash_cooldown()
+
+        # Visual state for blinking
+        self.visible = True
+        self.blink_timer = 0.0
+
+    def _reset_dash_cooldown(self):
+        """Pick a new random cooldown before the next dash"""
+        self.dash_cooldown = random.uniform(
+            self.DASH_COOLDOWN_MIN, self.DASH_COOLDOWN_MAX
+        )
+
+    def tick_dash(self, dt, x, y, player_position, distance_to_player):
+        """
+        Advance the dash state machine by one frame
+
+        Args:
+            dt: Delta time in seconds
+            x, y: Current enemy position
+            player_position: Vector2 of player position
+            distance_to_player: Current distance to player
+
+        Returns:
+            tuple: New (x, y) while telegraphing or dashing, None when the
+            enemy is free to use its normal movement this frame
+        """
+        # Idle: tick cooldown, start telegraph when ready (flags tested once)
+        if self.can_dash and not (self.is_telegraphing or self.is_dashing):
+            self.dash_cooldown -= dt
+            if self.dash_cooldown <= 0 and self._dash_ready(distance_to_player):
+                self._start_telegraph(player_position)
+
+        # Handle telegraph (blinking warning)
+        if self.is_telegraphing:
+            self.telegraph_timer -= dt
+
+            self.blink_timer += dt
+            if self.blink_timer >= self.BLINK_INTERVAL:
+                self.visible = not self.visible
+                self.blink_timer = 0.0
+
+            # Telegraph finished - start dash!
+            if self.telegraph_timer <= 0:
+                self.is_telegraphing = False
+                self.visible = True
+                self._on_telegraph_end()
+                self._start_dash()
+            return x, y
+
+        # Handle dash movement
+        if self.is_dashing:
+            self.dash_timer -= dt
+
+            if self.dash_timer <= 0:
+                self.is_dashing = False
+                self._on_dash_end()
+            else:
+                dash_step = self._get_dash_speed() * dt
+                dash_x, dash_y = self.dash_direction
+                x += dash_x * dash_step
+                y += dash_y * dash_step
+            return x, y
+
+        return None
+
+    def _start_telegraph(self, player_position):
+        """
+        Start telegraph warning and lock the dash direction toward the player
+
+        Args:
+            player_position: Vector2 of player position
+        """
+        self.is_telegraphing = True
+        self.telegraph_timer = self.TELEGRAPH_DURATION
+        self.visible = True
+        self.blink_timer = 0.0
+
+        dx = player_position.x - self.position.x
+        dy = player_position.y - self.position.y
+        dist_sq = dx * dx + dy * dy
+        if dist_sq > 0:
+            inv_len = 1.0 / math.sqrt(dist_sq)
+            self.dash_direction = (dx * inv_len, dy * inv_len)
+        else:
+            self.dash_direction = (0.0, 0.0)
+
+        self._on_telegraph_start()
+
+    def _start_dash(self):
+        """Start the dash (after telegraph)"""
+        self.is_dashing = True
+        self.dash_timer = self.DASH_DURATION
+        self.dash_hit_player = False
+
+    # ==================== HOOKS ====================
+
+    def _dash_ready(self, distance_to_player):
+        """Extra condition for starting a dash once the cooldown is over"""
+        return True
+
+    def _get_dash_speed(self):
+        """Dash speed in pixels per second"""
+        return self.DASH_SPEED
+
+    def _on_telegraph_start(self):
+        """Called when the telegraph starts"""
+
+    def _on_telegraph_end(self):
+        """Called when the telegraph ends, right before the dash"""
+
+    def _on_dash_end(self):
+        """Called when the dash ends (default: start a new cooldown)"""
+        self._reset_dash_cooldown()
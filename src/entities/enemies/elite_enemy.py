@@ -3,16 +3,36 @@ Elite Enemy
 Balanced enemy with high XP value
 """
 
+import math
 import pygame
 import random
 from src.entities.enemies.base_enemy import Enemy
+from src.entities.enemies.dash_behavior import DashBehavior
 from src.config.enemies.elite_enemy import EliteEnemyConfig
-from src.config.common.colors import Colors
+from src.config.common.colors import RED, GREEN, GOLD
+from src.rendering.surface_cache import blit_circle
 
 
-class EliteEnemy(Enemy):
+class EliteEnemy(DashBehavior, Enemy):
     """Elite enemy - balanced stats, high XP reward"""
 
+    __slots__ = DashBehavior.DASH_SLOTS + (
+        "damage",
+        "dash_min_distance",
+        "invulnerable",
+        "dash_slow_duration",
+        "dash_slow_strength",
+    )
+
+    # Dash tuning (DashBehavior)
+    DASH_PROBABILITY = 0.9  # 90% chance to have dash ability
+    DASH_SPEED_MULTIPLIER = 5  # 5x normal speed
+    DASH_DURATION = 0.8  # Fixed duration - always long!
+    DASH_COOLDOWN_MIN = 3.0  # seconds
+    DASH_COOLDOWN_MAX = 5.0  # seconds
+    TELEGRAPH_DURATION = 0.5  # seconds to blink before dash
+    BLINK_INTERVAL = 1.0 / 8.0  # 8 blinks per second
+
     def __init__(self, x, y):
         """Initialize elite enemy"""
         super().__init__(x, y, EliteEnemyConfig)
@@ -20,43 +40,20 @@ class EliteEnemy(Enemy):
         # Enhanced stats
         self.max_health = 50
         self.health = self.max_health
+        self._inv_max_health = 1.0 / self.max_health
         self.speed = 100
         self.damage = 15
         self.xp_value = 5
 
         # Visual
-        self.color = (255, 215, 0)  # Gold
+        self.color = GOLD
         self.size = 35
         self.radius = self.size // 2
 
-        # Dash mechanics - PARAMETERS
-        self.dash_probability = 0.9  # 90% chance to have dash ability
-        self.dash_speed_multiplier = 5  # 5x normal speed
-        self.dash_duration = 0.8  # Fixed duration - always long! ← SINGLE VALUE
-        self.dash_cooldown_min = 3.0  # seconds
-        self.dash_cooldown_max = 5.0  # seconds
+        # Dash mechanics - this enemy may or may not have the ability
         self.dash_min_distance = self.size * 2  # Don't get closer than 2x size
-        # Telegraph (warning blink) - ADJUSTABLE# Telegraph (warning blink)
-        self.telegraph_duration = 0.5  # seconds to blink before dash
-        self.telegraph_blink_speed = 8.0  # blinks per second
-
-        # Determine if THIS enemy can dash
-        self.can_dash = random.random() < self.dash_probability
-
-        # Dash state
-        self.is_telegraphing = False
-        self.telegraph_timer = 0.0
-        self.is_dashing = False
-        self.dash_timer = 0.0
         self.invulnerable = False
-        self.dash_direction = pygame.math.Vector2(0, 0)
-        self.dash_cooldown_timer = random.uniform(
-            self.dash_cooldown_min, self.dash_cooldown_max
-        )
-
-        # Visual state for blinking
-        self.visible = True
-        self.blink_timer = 0.0
+        self._init_dash(can_dash=random.random() < self.DASH_PROBABILITY)
 
         # Dash debuff parameters
         self.dash_slow_duration = 2.0  # 2 seconds of slow
@@ -70,92 +67,38 @@ class EliteEnemy(Enemy):
             dt: Delta time in seconds
             player_position: Vector2 of player position
         """
-        distance_to_player = self.position.distance_to(player_position)
-
-        # Update dash cooldown (when not telegraphing or dashing)
-        if not self.is_telegraphing and not self.is_dashing and self.can_dash:
-            self.dash_cooldown_timer -= dt
-
-        # Check if should start telegraph (warning before dash)
-        if (
-            self.can_dash
-            and not self.is_telegraphing
-            and not self.is_dashing
-            and self.dash_cooldown_timer <= 0
-        ):
-            self._start_telegraph(player_position, distance_to_player)
-
-        # Handle telegraph (blinking warning)
-        if self.is_telegraphing:
-            self.telegraph_timer -= dt
-
-            # Update blink effect
-            self.blink_timer += dt
-            blink_interval = 1.0 / self.telegraph_blink_speed
-            if self.blink_timer >= blink_interval:
-                self.visible = not self.visible  # Toggle visibility
-                self.blink_timer = 0.0
-
-            # Telegraph finished - start dash!
-            if self.telegraph_timer <= 0:
-                self.is_telegraphing = False
-                self.visible = True  # Make sure visible when dashing
-                self.invulnerable = False
-                self._start_dash()
-
-        # Handle dashing movement
-        elif self.is_dashing:
-            self.dash_timer -= dt
-
-            if self.dash_timer <= 0:
-                # Dash duration ended
-                self.is_dashing = False
-                self.dash_cooldown_timer = random.uniform(
-                    self.dash_cooldown_min, self.dash_cooldown_max
-                )
-            else:
-                # Continue dash movement
-                dash_velocity = (
-                    self.dash_direction * self.speed * self.dash_speed_multiplier
-                )
-                self.position += dash_velocity * dt
+        # Plain float math (no Vector2 temporaries per frame)
+        position = self.position
+        x = position.x
+        y = position.y
+        dx = player_position.x - x
+        dy = player_position.y - y
+        distance_to_player = math.sqrt(dx * dx + dy * dy)
+
+        # Telegraph / dash own the movement while active
+        dash_position = self.tick_dash(dt, x, y, player_position, distance_to_player)
+        if dash_position is not None:
+            x, y = dash_position
 
         # Normal movement toward player (when not telegraphing or dashing)
-        else:
-            direction = player_position - self.position
-            if direction.length() > 0:
-                direction = direction.normalize()
-                self.position += direction * self.speed * dt
+        elif distance_to_player > 0:
+            step = self.speed * dt / distance_to_player
+            x += dx * step
+            y += dy * step
 
-        # Update rect for collision
-        self.rect.center = (int(self.position.x), int(self.position.y))
+        position.update(x, y)
 
-    def _start_telegraph(self, player_position, distance_to_player):
-        """
-        Start telegraph (warning blink) before dash
+    def _get_dash_speed(self):
+        """Dash speed scales with current speed"""
+        return self.speed * self.DASH_SPEED_MULTIPLIER
 
-        Args:
-            player_position: Vector2 of player position
-            distance_to_player: Current distance to player (not used now)
-        """
-        self.is_telegraphing = True
-        self.telegraph_timer = self.telegraph_duration
-        self.visible = True
-        self.blink_timer = 0.0
+    def _on_telegraph_start(self):
+        """Immune while telegraphing"""
         self.invulnerable = True
 
-        # Calculate dash direction (save for later)
-        direction = player_position - self.position
-        if direction.length() > 0:
-            self.dash_direction = direction.normalize()
-        else:
-            self.dash_direction = pygame.math.Vector2(0, 0)
-
-    def _start_dash(self):
-        """Start the dash (after telegraph)"""
-        self.is_dashing = True
-        self.dash_timer = self.dash_duration
-        self.dash_hit_player = False
+    def _on_telegraph_end(self):
+        """Vulnerable again once the dash starts"""
+        self.invulnerable = False
 
     def render(self, screen, camera, player_position):
         """
@@ -170,12 +113,10 @@ class EliteEnemy(Enemy):
             return
 
         # Get screen position
-        screen_pos = camera.apply(self.position)
+        sx, sy = camera.apply(self.position)
 
         # Draw enemy circle
-        pygame.draw.circle(
-            screen, self.color, (int(screen_pos.x), int(screen_pos.y)), self.radius
-        )
+        blit_circle(screen, self.color, (int(sx), int(sy)), self.radius)
 
         # Add visual indicator if telegraphing (about to dash)
         if self.is_telegraphing:
@@ -183,30 +124,32 @@ class EliteEnemy(Enemy):
             warning_radius = self.radius + 10
             pygame.draw.circle(
                 screen,
-                (255, 0, 0),  # Red warning
-                (int(screen_pos.x), int(screen_pos.y)),
+                RED,  # Red warning
+                (int(sx), int(sy)),
                 warning_radius,
                 3,  # Line width
             )
 
-        self._draw_health_bar(screen, screen_pos)
+        self._draw_health_bar(screen, sx, sy)
 
-    def _draw_health_bar(self, screen, screen_pos):
-        """Draw health bar above enemy"""
+    def _draw_health_bar(
+        self, screen, sx, sy, red=RED, green=GREEN, draw_rect=pygame.draw.rect
+    ):
+        """Draw health bar above enemy (colors/draw bound as fast locals)"""
         if self.health >= self.max_health:
             return  # Don't show full health bar
 
         bar_width = self.size
-        bar_height = 4
-        bar_x = screen_pos.x - bar_width // 2
-        bar_y = screen_pos.y - self.radius - 10
+        bar_height = self.HEALTH_BAR_HEIGHT
+        bar_x = sx - bar_width // 2
+        bar_y = sy - self.radius - 10
 
         # Background (red)
-        pygame.draw.rect(screen, Colors.RED, (bar_x, bar_y, bar_width, bar_height))
+        draw_rect(screen, red, (bar_x, bar_y, bar_width, bar_height))
 
         # Foreground (green) - current health
-        health_width = int(bar_width * (self.health / self.max_health))
-        pygame.draw.rect(screen, Colors.GREEN, (bar_x, bar_y, health_width, bar_height))
+        health_width = int(bar_width * self.health * self._inv_max_health)
+        draw_rect(screen, green, (bar_x, bar_y, health_width, bar_height))
 
     def take_damage(self, damage):
         """
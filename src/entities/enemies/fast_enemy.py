@@ -3,16 +3,36 @@ Fast Enemy
 Fast, agile enemy that circles player and performs dash attacks
 """
 
+import math
 import pygame
 import random
 from src.entities.enemies.base_enemy import Enemy
+from src.entities.enemies.dash_behavior import DashBehavior
 from src.config.enemies.fast_enemy import FastEnemyConfig
-from src.config.common.colors import Colors
+from src.systems.enemy_animation import EnemyAnimationConfig
+from src.config.common.colors import RED, GREEN
+from src.rendering.surface_cache import blit_circle
 
 
-class FastEnemy(Enemy):
+class FastEnemy(DashBehavior, Enemy):
     """Fast enemy - circles player and dashes"""
 
+    __slots__ = DashBehavior.DASH_SLOTS + (
+        "damage",
+        "circle_direction",
+        "ready_to_explode",
+    )
+
+    _frame_duration = EnemyAnimationConfig.FAST_ENEMY_FRAME_DURATION  # Faster!
+
+    # Dash tuning (DashBehavior)
+    DASH_COOLDOWN_MIN = FastEnemyConfig.DASH_COOLDOWN_MIN
+    DASH_COOLDOWN_MAX = FastEnemyConfig.DASH_COOLDOWN_MAX
+    DASH_DURATION = FastEnemyConfig.DASH_DURATION
+    DASH_SPEED = FastEnemyConfig.DASH_SPEED
+    TELEGRAPH_DURATION = FastEnemyConfig.TELEGRAPH_DURATION
+    BLINK_INTERVAL = 0.1
+
     def __init__(self, x, y):
         """Initialize fast enemy"""
         super().__init__(x, y, FastEnemyConfig)
@@ -20,6 +40,7 @@ class FastEnemy(Enemy):
         # Stats
         self.max_health = 5
         self.health = self.max_health
+        self._inv_max_health = 1.0 / self.max_health
         self.speed = 120
         self.damage = 3
         self.xp_value = 2
@@ -32,180 +53,115 @@ class FastEnemy(Enemy):
         # Circling behavior
         self.circle_direction = random.choice([1, -1])  # Random rotation direction
 
-        # Dash state
-        self.can_dash = True
-        self.is_telegraphing = False
-        self.telegraph_timer = 0.0
-        self.is_dashing = False
-        self.dash_timer = 0.0
-        self.dash_direction = pygame.math.Vector2(0, 0)
-        self.dash_cooldown = random.uniform(
-            FastEnemyConfig.DASH_COOLDOWN_MIN, FastEnemyConfig.DASH_COOLDOWN_MAX
-        )
-
-        # Visual state
-        self.visible = True
-        self.blink_timer = 0.0
+        # Dash state (cooldown -> telegraph -> dash)
+        self._init_dash()
+        self.ready_to_explode = False  # Set when a dash ends in an explosion
 
     def update(self, dt, player_position):
         """Update fast enemy with circling and dash behavior"""
-        distance_to_player = self.position.distance_to(player_position)
-
-        # Update dash cooldown
-        if not self.is_telegraphing and not self.is_dashing and self.can_dash:
-            self.dash_cooldown -= dt
-
-        # Check if should start telegraph
-        if (
-            self.can_dash
-            and not self.is_telegraphing
-            and not self.is_dashing
-            and self.dash_cooldown <= 0
-        ):
-            # Only dash when orbiting (not too far, not too close)
-            if (
-                abs(distance_to_player - FastEnemyConfig.ORBIT_DISTANCE)
-                < FastEnemyConfig.ORBIT_THRESHOLD * 2
-            ):
-                self._start_telegraph(player_position)
-
-        # Handle telegraph (warning)
-        if self.is_telegraphing:
-            self.telegraph_timer -= dt
-
-            # Blink effect
-            self.blink_timer += dt
-            if self.blink_timer >= 0.1:
-                self.visible = not self.visible
-                self.blink_timer = 0.0
-
-            if self.telegraph_timer <= 0:
-                self.is_telegraphing = False
-                self.visible = True
-                self._start_dash()
-
-        # Handle dash movement
-        elif self.is_dashing:
-            self.dash_timer -= dt
-
-            if self.dash_timer <= 0:
-                # Dash ended
-                self.is_dashing = False
-
-                # 30% chance to explode!
-                if random.random() < FastEnemyConfig.EXPLOSION_CHANCE:
-                    # Mark for explosion (game_engine will spawn lasers)
-                    self.ready_to_explode = True
-                else:
-                    # Normal dash end - reset cooldown
-                    self.dash_cooldown = random.uniform(
-                        FastEnemyConfig.DASH_COOLDOWN_MIN,
-                        FastEnemyConfig.DASH_COOLDOWN_MAX,
-                    )
-                    # Reverse circle direction after dash
-                    self.circle_direction *= -1
-            else:
-                # Continue dash movement
-                velocity = self.dash_direction * FastEnemyConfig.DASH_SPEED
-                self.position += velocity * dt
+        # Plain float math (no Vector2 temporaries per frame)
+        position = self.position
+        x = position.x
+        y = position.y
+        dx = player_position.x - x
+        dy = player_position.y - y
+        distance_to_player = math.sqrt(dx * dx + dy * dy)
+
+        # Telegraph / dash own the movement while active
+        dash_position = self.tick_dash(dt, x, y, player_position, distance_to_player)
+        if dash_position is not None:
+            x, y = dash_position
 
         # Normal circling movement
         else:
-            direction = player_position - self.position
-            if direction.length() > 0:
-                direction = direction.normalize()
+            if distance_to_player > 0:
+                nx = dx / distance_to_player
+                ny = dy / distance_to_player
+            else:
+                nx = ny = 0.0
 
+            speed = self.speed
             if (
                 distance_to_player
                 > FastEnemyConfig.ORBIT_DISTANCE + FastEnemyConfig.ORBIT_THRESHOLD
             ):
                 # Too far - chase
-                velocity = direction * self.speed
+                vx = nx * speed
+                vy = ny * speed
             elif (
                 distance_to_player
                 < FastEnemyConfig.ORBIT_DISTANCE - FastEnemyConfig.ORBIT_THRESHOLD
             ):
                 # Too close - back away
-                velocity = -direction * self.speed * FastEnemyConfig.RADIAL_SPEED_MULT
+                back = -speed * FastEnemyConfig.RADIAL_SPEED_MULT
+                vx = nx * back
+                vy = ny * back
             else:
-                # Orbit - circle around player
-                perpendicular = pygame.math.Vector2(
-                    -direction.y * self.circle_direction,
-                    direction.x * self.circle_direction,
-                )
-
+                # Orbit - circle around player (perpendicular minus radial error)
+                orbit = speed * self.circle_direction
                 distance_error = distance_to_player - FastEnemyConfig.ORBIT_DISTANCE
-                radial_correction = (
-                    direction * distance_error * FastEnemyConfig.RADIAL_SPEED_MULT
-                )
-
-                velocity = (perpendicular * self.speed) - radial_correction
-
-            self.position += velocity * dt
-
-        # Update rect
-        self.rect.center = (int(self.position.x), int(self.position.y))
+                correction = distance_error * FastEnemyConfig.RADIAL_SPEED_MULT
+                vx = -ny * orbit - nx * correction
+                vy = nx * orbit - ny * correction
 
-    def _start_telegraph(self, player_position):
-        """Start telegraph warning before dash"""
-        self.is_telegraphing = True
-        self.telegraph_timer = FastEnemyConfig.TELEGRAPH_DURATION
-        self.visible = True
-        self.blink_timer = 0.0
+            x += vx * dt
+            y += vy * dt
 
-        # Calculate dash direction to opposite side
-        # Mirror enemy position across player
-        # If enemy is left of player, dash to right side
-        enemy_to_player = player_position - self.position
+        position.update(x, y)
 
-        # Opposite position = player + (player - enemy) = mirror across player
-        opposite_position = player_position + enemy_to_player
-
-        # Direction from current position to opposite side
-        dash_vector = opposite_position - self.position
-        if dash_vector.length() > 0:
-            self.dash_direction = dash_vector.normalize()
+    def _dash_ready(self, distance_to_player):
+        """Only dash when orbiting (not too far, not too close)"""
+        return (
+            abs(distance_to_player - FastEnemyConfig.ORBIT_DISTANCE)
+            < FastEnemyConfig.ORBIT_THRESHOLD * 2
+        )
 
-    def _start_dash(self):
-        """Start the dash attack"""
-        self.is_dashing = True
-        self.dash_timer = FastEnemyConfig.DASH_DURATION
-        self.dash_hit_player = False
+    def _on_dash_end(self):
+        """Dash ended - maybe explode, otherwise cool down and turn around"""
+        # 30% chance to explode!
+        if random.random() < FastEnemyConfig.EXPLOSION_CHANCE:
+            # Mark for explosion (game_engine will spawn lasers)
+            self.ready_to_explode = True
+        else:
+            # Normal dash end - reset cooldown
+            self._reset_dash_cooldown()
+            # Reverse circle direction after dash
+            self.circle_direction *= -1
 
     def render(self, screen, camera, player_position):
         """Render fast enemy with blink effect"""
         if not self.visible:
             return
 
-        screen_pos = camera.apply(self.position)
+        sx, sy = camera.apply(self.position)
 
         # Color changes during telegraph
         color = FastEnemyConfig.TELEGRAPH_COLOR if self.is_telegraphing else self.color
 
         # Draw enemy circle
-        pygame.draw.circle(
-            screen, color, (int(screen_pos.x), int(screen_pos.y)), self.radius
-        )
+        blit_circle(screen, color, (int(sx), int(sy)), self.radius)
 
-        self._draw_health_bar(screen, screen_pos)
+        self._draw_health_bar(screen, sx, sy)
 
-    def _draw_health_bar(self, screen, screen_pos):
-        """Draw health bar above enemy"""
+    def _draw_health_bar(
+        self, screen, sx, sy, red=RED, green=GREEN, draw_rect=pygame.draw.rect
+    ):
+        """Draw health bar above enemy (colors/draw bound as fast locals)"""
         if self.health >= self.max_health:
             return
 
         bar_width = self.size
-        bar_height = 4
-        bar_x = screen_pos.x - bar_width // 2
-        bar_y = screen_pos.y - self.radius - 10
+        bar_height = self.HEALTH_BAR_HEIGHT
+        bar_x = sx - bar_width // 2
+        bar_y = sy - self.radius - 10
 
-        pygame.draw.rect(screen, Colors.RED, (bar_x, bar_y, bar_width, bar_height))
-        health_width = int(bar_width * (self.health / self.max_health))
-        pygame.draw.rect(screen, Colors.GREEN, (bar_x, bar_y, health_width, bar_height))
+        draw_rect(screen, red, (bar_x, bar_y, bar_width, bar_height))
+        health_width = int(bar_width * self.health * self._inv_max_health)
+        draw_rect(screen, green, (bar_x, bar_y, health_width, bar_height))
 
     def should_explode(self):
         """Check if enemy should explode"""
-        return hasattr(self, "ready_to_explode") and self.ready_to_explode
+        return self.ready_to_explode
 
     def get_explosion_position(self):
         """Get position for laser explosion"""
@@ -3,17 +3,33 @@ Tank Enemy
 Slow, high-health enemy that deals heavy damage
 """
 
+import math
 import pygame
 import random
 from src.entities.enemies.base_enemy import Enemy
 from src.config.enemies.tank_enemy import TankEnemyConfig
+from src.systems.enemy_animation import EnemyAnimationConfig
 from src.config.enemies.tank_laser import TankLaserConfig
-from src.config.common.colors import Colors
+from src.config.common.colors import RED, GREEN
+from src.rendering.surface_cache import blit_circle
 
 
 class TankEnemy(Enemy):
     """Tank enemy - low speed, high health and damage"""
 
+    __slots__ = (
+        "damage",
+        "can_shoot",
+        "shoot_cooldown",
+        "is_telegraphing",
+        "telegraph_timer",
+        "target_position",
+        "ready_to_shoot",
+        "flash_color",
+    )
+
+    _frame_duration = EnemyAnimationConfig.TANK_ENEMY_FRAME_DURATION  # Slower!
+
     def __init__(self, x, y):
         """Initialize tank enemy"""
         super().__init__(x, y, TankEnemyConfig)
@@ -21,6 +37,7 @@ class TankEnemy(Enemy):
         # Stats
         self.max_health = 30
         self.health = self.max_health
+        self._inv_max_health = 1.0 / self.max_health
         self.speed = 50
         self.damage = 10
         self.xp_value = 3
@@ -38,6 +55,7 @@ class TankEnemy(Enemy):
         self.is_telegraphing = False
         self.telegraph_timer = 0.0
         self.target_position = None  # Saved player position for shot
+        self.ready_to_shoot = False  # Set when telegraph finishes
 
         # Visual state
         self.flash_color = (255, 100, 100)  # Red flash when telegraphing
@@ -71,15 +89,19 @@ class TankEnemy(Enemy):
                 self.is_telegraphing = False
                 self.ready_to_shoot = True  # Flag for game_engine to spawn laser
 
-        # Normal movement toward player
+        # Normal movement toward player (float math, no Vector2 temporaries)
+        position = self.position
+        x = position.x
+        y = position.y
         if not self.is_telegraphing:
-            direction = player_position - self.position
-            if direction.length() > 0:
-                direction = direction.normalize()
-                self.position += direction * self.speed * dt
-
-        # Update rect for collision
-        self.rect.center = (int(self.position.x), int(self.position.y))
+            dx = player_position.x - x
+            dy = player_position.y - y
+            dist_sq = dx * dx + dy * dy
+            if dist_sq > 0:
+                step = self.speed * dt / math.sqrt(dist_sq)
+                x += dx * step
+                y += dy * step
+                position.update(x, y)
 
     def _start_telegraph(self, player_position):
         """Start telegraph warning before shooting"""
@@ -90,7 +112,7 @@ class TankEnemy(Enemy):
 
     def should_shoot(self):
         """Check if tank is ready to shoot"""
-        return hasattr(self, "ready_to_shoot") and self.ready_to_shoot
+        return self.ready_to_shoot
 
     def get_shot_data(self):
         """Get data for creating laser shot"""
@@ -105,31 +127,31 @@ class TankEnemy(Enemy):
 
     def render(self, screen, camera, player_position):
         """Render tank enemy with telegraph flash"""
-        screen_pos = camera.apply(self.position)
+        sx, sy = camera.apply(self.position)
 
         # Flash red when telegraphing
         color = self.flash_color if self.is_telegraphing else self.color
 
         # Draw enemy circle
-        pygame.draw.circle(
-            screen, color, (int(screen_pos.x), int(screen_pos.y)), self.radius
-        )
+        blit_circle(screen, color, (int(sx), int(sy)), self.radius)
 
-        self._draw_health_bar(screen, screen_pos)
+        self._draw_health_bar(screen, sx, sy)
 
-    def _draw_health_bar(self, screen, screen_pos):
-        """Draw health bar above enemy"""
+    def _draw_health_bar(
+        self, screen, sx, sy, red=RED, green=GREEN, draw_rect=pygame.draw.rect
+    ):
+        """Draw health bar above enemy (colors/draw bound as fast locals)"""
         if self.health >= self.max_health:
             return
 
         bar_width = self.size
-        bar_height = 4
-        bar_x = screen_pos.x - bar_width // 2
-        bar_y = screen_pos.y - self.radius - 10
+        bar_height = self.HEALTH_BAR_HEIGHT
+        bar_x = sx - bar_width // 2
+        bar_y = sy - self.radius - 10
 
         # Background (red)
-        pygame.draw.rect(screen, Colors.RED, (bar_x, bar_y, bar_width, bar_height))
+        draw_rect(screen, red, (bar_x, bar_y, bar_width, bar_height))
 
         # Foreground (green)
-        health_width = int(bar_width * (self.health / self.max_health))
-        pygame.draw.rect(screen, Colors.GREEN, (bar_x, bar_y, health_width, bar_height))
+        health_width = int(bar_width * self.health * self._inv_max_health)
+        draw_rect(screen, green, (bar_x, bar_y, health_width, bar_height))
@@ -1,16 +1,18 @@
 """
 Pickup Entities
-All pickup classes
+All pickup classes (loaded lazily)
 """
 
-from .base_pickup import BasePickup
-from .xp_orb import XPOrb
-from .health_pickup import HealthPickup
-from .bomb_pickup import BombPickup
+from src.lazy_loader import lazy_exports
 
-__all__ = [
-    "BasePickup",
-    "XPOrb",
-    "HealthPickup",
-    "BombPickup",
-]
+# Public name -> submodule (relative to this package) that defines it
+_LAZY = {
+    "BasePickup": ".base_pickup",
+    "XPOrb": ".xp_orb",
+    "HealthPickup": ".health_pickup",
+    "BombPickup": ".bomb_pickup",
+}
+
+__all__ = list(_LAZY)
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
@@ -4,11 +4,37 @@ Abstract base class for all pickups (XP, health, powerups, etc.)
 """
 
 import pygame
-from abc import ABC, abstractmethod
 
 
-class BasePickup(pygame.sprite.Sprite, ABC):
-    """Base class for all pickups"""
+class BasePickup(pygame.sprite.Sprite):
+    """
+    Base class for all pickups
+    Plain class (no ABC metaclass): required methods raise NotImplementedError
+    """
+
+    # True for pickups the game steps in one batch (see XPOrb)
+    batch_steering = False
+
+    # Extra pixels around the body radius the look needs (outlines, fuses)
+    BODY_PADDING = 0
+
+    # (class, color, radius) -> (pre-rendered body, half size)
+    _body_cache = {}
+
+    # Shared clock (seconds, advanced once per frame by tick_clock); pulses
+    # derive from it, so resting pickups need no per-frame update
+    clock = 0.0
+
+    # Pulse phase per second (subclasses that pulse override it)
+    pulse_speed = 0.0
+
+    # Free list of collected pickups (one list per subclass)
+    _pool = []
+
+    def __init_subclass__(cls, **kwargs):
+        """Give every pickup class its own free list"""
+        super().__init_subclass__(**kwargs)
+        cls._pool = []
 
     def __init__(self, x, y, radius=8):
         """
@@ -23,11 +49,65 @@ class BasePickup(pygame.sprite.Sprite, ABC):
         self.position = pygame.math.Vector2(x, y)
         self.radius = radius
 
+        # Pulse starts at 0 on spawn
+        self._spawn_time = BasePickup.clock
+
         # For sprite collision
         self.rect = pygame.Rect(0, 0, radius * 2, radius * 2)
         self.rect.center = (int(self.position.x), int(self.position.y))
 
-    @abstractmethod
+    @classmethod
+    def acquire(cls, x, y, *args):
+        """
+        Get a pickup placed at (x, y) - recycled from the free list when
+        possible, so kills don't allocate a Vector2/Rect/Sprite each
+
+        Args:
+            x: X position
+            y: Y position
+            *args: Subclass value (xp_value, heal_amount, bomb_amount)
+
+        Returns:
+            BasePickup: Ready-to-add pickup
+        """
+        pool = cls._pool
+        if pool:
+            pickup = pool.pop()
+            pickup.reset(x, y, *args)
+            return pickup
+        return cls(x, y, *args)
+
+    def release(self):
+        """Return a collected pickup (out of every group) to its free list"""
+        self._pool.append(self)
+
+    def reset(self, x, y):
+        """
+        Re-place a recycled pickup as if freshly spawned
+
+        Args:
+            x: X position
+            y: Y position
+        """
+        self.position.update(x, y)
+        self.rect.center = (int(x), int(y))
+        self._spawn_time = BasePickup.clock
+
+    @staticmethod
+    def tick_clock(dt):
+        """
+        Advance the shared pickup clock (once per frame, not per pickup)
+
+        Args:
+            dt: Delta time in seconds
+        """
+        BasePickup.clock += dt
+
+    @property
+    def pulse_timer(self):
+        """Pulse phase: pulse_speed x seconds since spawn"""
+        return (BasePickup.clock - self._spawn_time) * self.pulse_speed
+
     def update(self, dt, player):
         """
         Update pickup state - MUST be implemented by subclass
@@ -36,20 +116,66 @@ class BasePickup(pygame.sprite.Sprite, ABC):
             dt: Delta time in seconds
             player: Player entity
         """
-        pass
+        raise NotImplementedError
+
+    def get_render_radius(self):
+        """
+        Get the body radius to draw this frame - MUST be implemented by subclass
+
+        Returns:
+            int: Radius in pixels (pulse animation included)
+        """
+        raise NotImplementedError
+
+    def _draw_body(self, surface, center, radius):
+        """
+        Draw the pickup body once into a cache surface - MUST be implemented
+
+        Args:
+            surface: Transparent surface sized for radius + BODY_PADDING
+            center: (x, y) centre of the surface
+            radius: Body radius in pixels
+        """
+        raise NotImplementedError
+
+    def get_blit(self, sx, sy):
+        """
+        Get the body surface and destination for a batched screen.blits()
+
+        Args:
+            sx: Screen x of the pickup centre
+            sy: Screen y of the pickup centre
+
+        Returns:
+            tuple: (surface, (x, y))
+        """
+        radius = self.get_render_radius()
+        key = (type(self), self.color, radius)
+        cached = self._body_cache.get(key)
+        if cached is None:
+            half = radius + self.BODY_PADDING
+            surface = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+            self._draw_body(surface, (half, half), radius)
+
+            # Convert to display format for the fast blit path (needs a window)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+
+            cached = self._body_cache[key] = (surface, half)
+
+        surface, half = cached
+        return surface, (int(sx) - half, int(sy) - half)
 
-    @abstractmethod
     def render(self, screen, camera):
         """
-        Draw the pickup - MUST be implemented by subclass
+        Draw the pickup (single blit of its cached body)
 
         Args:
             screen: Pygame surface to draw on
             camera: Camera object for world-to-screen conversion
         """
-        pass
+        screen.blit(*self.get_blit(*camera.apply(self.position)))
 
-    @abstractmethod
     def on_collect(self, player):
         """
         Called when player collects this pickup - MUST be implemented by subclass
@@ -60,7 +186,7 @@ class BasePickup(pygame.sprite.Sprite, ABC):
         Returns:
             Any value the pickup provides (XP amount, heal amount, etc.)
         """
-        pass
+        raise NotImplementedError
 
     def collides_with(self, entity):
         """
@@ -72,5 +198,5 @@ class BasePickup(pygame.sprite.Sprite, ABC):
         Returns:
             bool: True if colliding
         """
-        distance = self.position.distance_to(entity.position)
-        return distance < (self.radius + entity.radius)
+        reach = self.radius + entity.radius
+        return self.position.distance_squared_to(entity.position) < reach * reach
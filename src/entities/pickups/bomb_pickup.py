@@ -5,11 +5,15 @@ Gives player bombs when collected
 
 import pygame
 from src.entities.pickups.base_pickup import BasePickup
+from src.config.common.colors import GOLD
 
 
 class BombPickup(BasePickup):
     """Bomb pickup - restores bombs to player inventory"""
 
+    # Room for the gold outline and the fuse above the body
+    BODY_PADDING = 6
+
     def __init__(self, x, y, bomb_amount=1):
         """
         Initialize bomb pickup
@@ -25,7 +29,12 @@ class BombPickup(BasePickup):
         # Visual
         self.radius = 12
         self.color = (50, 50, 50)  # Dark gray (bomb color)
-        self.highlight_color = (255, 215, 0)  # Gold outline
+        self.highlight_color = GOLD  # Gold outline
+
+    def reset(self, x, y, bomb_amount=1):
+        """Re-place a recycled bomb pickup with a new bomb amount"""
+        super().reset(x, y)
+        self.bomb_amount = bomb_amount
 
     def update(self, dt, player):
         """Bomb pickups are stationary (don't chase)"""
@@ -44,30 +53,21 @@ class BombPickup(BasePickup):
         player.add_bombs(self.bomb_amount)
         return self.bomb_amount
 
-    def render(self, screen, camera):
-        """
-        Render bomb pickup
+    def get_render_radius(self):
+        """Bombs don't pulse"""
+        return self.radius
 
-        Args:
-            screen: Pygame surface
-            camera: Camera for position conversion
-        """
-        screen_pos = camera.apply(self.position)
+    def _draw_body(self, surface, center, radius):
+        """Gold-outlined bomb with a fuse on top"""
+        cx, cy = center
 
         # Draw outer gold circle
-        pygame.draw.circle(
-            screen,
-            self.highlight_color,
-            (int(screen_pos.x), int(screen_pos.y)),
-            self.radius + 2,
-        )
+        pygame.draw.circle(surface, self.highlight_color, center, radius + 2)
 
         # Draw inner bomb
-        pygame.draw.circle(
-            screen, self.color, (int(screen_pos.x), int(screen_pos.y)), self.radius
-        )
+        pygame.draw.circle(surface, self.color, center, radius)
 
         # Draw fuse (small line on top)
-        fuse_start = (int(screen_pos.x), int(screen_pos.y) - self.radius)
-        fuse_end = (int(screen_pos.x), int(screen_pos.y) - self.radius - 5)
-        pygame.draw.line(screen, (255, 140, 0), fuse_start, fuse_end, 2)
+        pygame.draw.line(
+            surface, (255, 140, 0), (cx, cy - radius), (cx, cy - radius - 5), 2
+        )
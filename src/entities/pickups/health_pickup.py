@@ -7,6 +7,7 @@ import pygame
 import math
 from src.entities.pickups.base_pickup import BasePickup
 from src.config import Colors
+from src.config.common.colors import WHITE
 
 
 class HealthPickup(BasePickup):
@@ -29,10 +30,14 @@ class HealthPickup(BasePickup):
         # Visual properties
         self.color = Colors.RED
 
-        # Animation
-        self.pulse_timer = 0.0
+        # Animation (pulse_timer derives from the shared pickup clock)
         self.pulse_speed = 4.0
 
+    def reset(self, x, y, heal_amount=20):
+        """Re-place a recycled health pickup with a new heal amount"""
+        super().reset(x, y)
+        self.heal_amount = heal_amount
+
     def update(self, dt, player):
         """
         Update health pickup (no chasing, just sits there)
@@ -41,39 +46,19 @@ class HealthPickup(BasePickup):
             dt: Delta time in seconds
             player: Player entity
         """
-        # Update pulse animation
-        self.pulse_timer += dt * self.pulse_speed
-
         # Health pickups don't chase - they just sit there!
-        # Update rect for collision
-        self.rect.center = (int(self.position.x), int(self.position.y))
-
-    def render(self, screen, camera):
-        """
-        Draw the health pickup as a red heart/cross
+        # (pulse comes from the shared clock, rect never moves)
+        pass
 
-        Args:
-            screen: Pygame surface to draw on
-            camera: Camera object for world-to-screen conversion
-        """
-        screen_pos = camera.apply(self.position)
-
-        # Pulsing size effect
+    def get_render_radius(self):
+        """Pulsing size effect"""
         pulse = math.sin(self.pulse_timer) * 0.2 + 1.0
-        render_radius = int(self.radius * pulse)
-
-        # Draw as red circle (or you can make it a cross/heart later)
-        pygame.draw.circle(
-            screen, self.color, (int(screen_pos.x), int(screen_pos.y)), render_radius
-        )
-
-        # Draw white center
-        pygame.draw.circle(
-            screen,
-            Colors.WHITE,
-            (int(screen_pos.x), int(screen_pos.y)),
-            max(3, render_radius - 3),
-        )
+        return int(self.radius * pulse)
+
+    def _draw_body(self, surface, center, radius):
+        """Red circle with a white center (or a cross/heart later)"""
+        pygame.draw.circle(surface, self.color, center, radius)
+        pygame.draw.circle(surface, WHITE, center, max(3, radius - 3))
 
     def on_collect(self, player):
         """
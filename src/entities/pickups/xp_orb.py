@@ -4,13 +4,24 @@ Green orb that gives XP and chases the player
 """
 
 import pygame
+from math import cos, pi
 from src.entities.pickups.base_pickup import BasePickup
+from src.systems.pickup_steering import step_xp_orbs
 from src.config import Colors
+from src.config.common.colors import WHITE
 
 
 class XPOrb(BasePickup):
     """XP orb that chases player and gives XP on collection"""
 
+    # True when the class keeps the base orb update (batch-steerable)
+    batch_steering = True
+
+    def __init_subclass__(cls, **kwargs):
+        """Flag subclasses with a custom update() as not batchable"""
+        super().__init_subclass__(**kwargs)
+        cls.batch_steering = cls.update is XPOrb.update
+
     def __init__(self, x, y, xp_value=1):
         """
         Initialize XP orb
@@ -28,13 +39,17 @@ class XPOrb(BasePickup):
         # Visual properties
         self.color = Colors.CYAN
 
-        # Animation
-        self.pulse_timer = 0.0
+        # Animation (pulse_timer derives from the shared pickup clock)
         self.pulse_speed = 3.0
 
         # Movement
         self.magnetic_speed = 200.0
 
+    def reset(self, x, y, xp_value=1):
+        """Re-place a recycled orb with a new XP value"""
+        super().reset(x, y)
+        self.xp_value = xp_value
+
     def update(self, dt, player):
         """
         Update XP orb with acceleration toward player
@@ -43,60 +58,24 @@ class XPOrb(BasePickup):
             dt: Delta time in seconds
             player: Player entity
         """
-        # Update pulse animation
-        self.pulse_timer += dt * self.pulse_speed
-
-        # Check if player is close enough for magnetic pull
-        distance = self.position.distance_to(player.position)
-
-        # Chase at 2x the pickup range
-        chase_distance = player.xp_pickup_range * 2
-
-        if distance < chase_distance:
-            # Calculate acceleration based on distance
-            # Closer = faster! (1x at edge, up to 5x when very close)
-            distance_ratio = distance / chase_distance  # 1.0 at edge, 0.0 at center
-            speed_multiplier = 1.0 + (4.0 * (1.0 - distance_ratio))  # 1x to 5x
-
-            current_speed = self.magnetic_speed * speed_multiplier
-
-            # Move toward player with accelerating speed
-            direction = player.position - self.position
-            if direction.length() > 0:
-                direction = direction.normalize()
-                self.position += direction * current_speed * dt
-
-        # Update rect for collision
-        self.rect.center = (int(self.position.x), int(self.position.y))
-
-    def render(self, screen, camera):
-        """
-        Draw the XP orb with pulse effect
-
-        Args:
-            screen: Pygame surface to draw on
-            camera: Camera object for world-to-screen conversion
-        """
-        screen_pos = camera.apply(self.position)
-
-        # Calculate pulse size (oscillates between 0.8 and 1.2)
-        pulse_scale = (
-            1.0 + 0.2 * pygame.math.Vector2(1, 0).rotate(self.pulse_timer * 180).x
+        step_xp_orbs(
+            (self,),
+            player.position.x,
+            player.position.y,
+            player.xp_pickup_range * 2,  # Chase at 2x the pickup range
+            dt,
         )
-        pulse_radius = int(self.radius * pulse_scale)
 
-        # Draw main orb
-        pygame.draw.circle(
-            screen, self.color, (int(screen_pos.x), int(screen_pos.y)), pulse_radius
-        )
+    def get_render_radius(self):
+        """Pulse radius (oscillates between 0.8x and 1.2x)"""
+        # cos of pulse_timer half-turns (no Vector2 rotate per orb per frame)
+        pulse_scale = 1.0 + 0.2 * cos(self.pulse_timer * pi)
+        return int(self.radius * pulse_scale)
 
-        # Draw white center
-        pygame.draw.circle(
-            screen,
-            Colors.WHITE,
-            (int(screen_pos.x), int(screen_pos.y)),
-            max(1, pulse_radius // 2),
-        )
+    def _draw_body(self, surface, center, radius):
+        """Cyan orb with a white center"""
+        pygame.draw.circle(surface, self.color, center, radius)
+        pygame.draw.circle(surface, WHITE, center, max(1, radius // 2))
 
     def on_collect(self, player):
         """
@@ -12,12 +12,48 @@ import random
 
 # from src.entities.weapons import LaserWeapon, SpreadWeapon
 from src.logger import logger
+from src.rendering.surface_cache import get_rotated_surface
 from src.systems.weapon_slot import WeaponSlot
 
 
 class Player(pygame.sprite.Sprite):
     """Player character"""
 
+    # Per-frame state read by update()/render() in slots (Sprite still
+    # provides a __dict__ for the rest)
+    __slots__ = (
+        "position",
+        "velocity",
+        "max_health",
+        "health",
+        "hp_regen",
+        "speed",
+        "size",
+        "rect",
+        "_half_size",
+        "max_stamina",
+        "stamina",
+        "stamina_regen",
+        "dash_speed",
+        "is_dashing",
+        "dash_timer",
+        "dash_cooldown",
+        "invulnerable",
+        "_move",
+        "is_slowed",
+        "slow_timer",
+        "slow_multiplier",
+        "bomb_cooldown",
+        "damage_immunity",
+        "damage_immunity_timer",
+        "base_sprite",
+        "angle",
+        "angle_cos",
+        "angle_sin",
+        "rendered_sprite",
+        "weapon_slots",
+    )
+
     def __init__(self, x, y):
         super().__init__()
         self.position = pygame.math.Vector2(x, y)
@@ -35,11 +71,12 @@ class Player(pygame.sprite.Sprite):
         # Visual properties
         self.size = PlayerConfig.SIZE
         self.color = PlayerConfig.COLOR
-        self.radius = PlayerConfig.get_radius()
+        self.radius = PlayerConfig.RADIUS
 
         # For sprite collision
         self.rect = pygame.Rect(0, 0, self.size, self.size)
         self.rect.center = (int(self.position.x), int(self.position.y))
+        self._half_size = self.size // 2  # rect centre offset (x/y writes)
         self.xp_pickup_range = 50.0
 
         self.max_stamina = 100.0
@@ -56,8 +93,10 @@ class Player(pygame.sprite.Sprite):
         self.is_dashing = False
         self.dash_timer = 0.0
         self.dash_cooldown = 0.0
-        self.dash_direction = pygame.math.Vector2(0, 0)
         self.invulnerable = False  # Brief invincibility during dash
+        # Movement step for the current state (swapped on dash start/end,
+        # so update() never branches on is_dashing)
+        self._move = self._move_walking
         # Debuffs
         self.is_slowed = False
         self.slow_timer = 0.0
@@ -66,6 +105,7 @@ class Player(pygame.sprite.Sprite):
         self.bomb_count = BombConfig.STARTING_BOMBS
         self.max_bombs = BombConfig.MAX_BOMBS
         self.bomb_cooldown = BombConfig.PLACEMENT_COOLDOWN
+        self.bomb_placement_cooldown = BombConfig.PLACEMENT_COOLDOWN
         # Damage invulnerability
         self.damage_immunity = False
         self.damage_immunity_timer = 0.0
@@ -80,6 +120,10 @@ class Player(pygame.sprite.Sprite):
             "src/assets/sprites/weapon_basic.png"
         ).convert_alpha()
         self.angle = 0  # Current rotation angle
+        # cos/sin of the body angle, computed once per aim change and shared
+        # by every weapon mount (no trig per slot per call)
+        self.angle_cos = 1.0
+        self.angle_sin = 0.0
         self.rendered_sprite = self.base_sprite
         # Weapon mount position (offset from player center)
         self.weapon_mount_offset = pygame.math.Vector2(21, -18)
@@ -95,10 +139,10 @@ class Player(pygame.sprite.Sprite):
 
         self.max_weapon_slots = 4
 
-        # Load weapon sprite (shared by all basic weapons)
-        self.weapon_sprite = pygame.image.load(
-            "src/assets/sprites/weapon_basic.png"
-        ).convert_alpha()
+        # Equipped weapon class -> count, updated only by add_weapon; slots
+        # must be filled through add_weapon, never equipped/unequipped
+        # directly, or has/count_weapon_type go stale
+        self._weapon_type_counts = {}
 
         # Start with one basic weapon in first slot
         # self.add_weapon(BasicWeapon())
@@ -133,79 +177,116 @@ class Player(pygame.sprite.Sprite):
 
     def update(self, dt, dx, dy, mouse_world_pos):
         """Update player state"""
-        # Update debuff timers
+        # Update debuff timers (each read once into a local, written once)
         if self.is_slowed:
-            self.slow_timer -= dt
-            if self.slow_timer <= 0:
+            slow_timer = self.slow_timer - dt
+            self.slow_timer = slow_timer
+            if slow_timer <= 0:
                 self.is_slowed = False
                 self.slow_multiplier = 1.0
                 logger.info("Slow effect ended!")
 
         if self.damage_immunity:
-            self.damage_immunity_timer -= dt
-            if self.damage_immunity_timer <= 0:
+            immunity_timer = self.damage_immunity_timer - dt
+            self.damage_immunity_timer = immunity_timer
+            if immunity_timer <= 0:
                 self.damage_immunity = False
 
         # Update bomb cooldown
-        if self.bomb_cooldown > 0:
-            self.bomb_cooldown -= dt
+        bomb_cooldown = self.bomb_cooldown
+        if bomb_cooldown > 0:
+            self.bomb_cooldown = bomb_cooldown - dt
 
         # Update dash cooldown
-        if self.dash_cooldown > 0:
-            self.dash_cooldown -= dt
-
-        # Handle dashing
-        if self.is_dashing:
-            self.dash_timer -= dt
-
-            if self.dash_timer <= 0:
-                # Dash ended
-                self.is_dashing = False
-                self.invulnerable = False
-                self.dash_cooldown = self.dash_cooldown_time
-                self.velocity = pygame.math.Vector2(0, 0)
-            else:
-                # Continue dash movement
-                self.velocity = self.dash_direction * self.dash_speed
-                self.position += self.velocity * dt
-        else:
-            # Normal movement
-            if dx != 0 or dy != 0:
-                # Normalize diagonal movement
-                direction = pygame.math.Vector2(dx, dy)
-                if direction.length() > 0:
-                    direction = direction.normalize()
-
-                current_speed = self.speed * self.slow_multiplier
-                self.velocity = direction * current_speed
-                self.position += self.velocity * dt
-            else:
-                self.velocity = pygame.math.Vector2(0, 0)
-
-        # Health regeneration
-        if self.hp_regen > 0:
-            self.health = min(self.health + self.hp_regen * dt, self.max_health)
+        dash_cooldown = self.dash_cooldown
+        if dash_cooldown > 0:
+            self.dash_cooldown = dash_cooldown - dt
+
+        # Walk or dash (state-specific step, see try_dash)
+        self._move(dt, dx, dy)
+        x = self.position.x
+        y = self.position.y
+
+        # Health regeneration (clamped with a compare, no min() call)
+        hp_regen = self.hp_regen
+        if hp_regen > 0:
+            max_health = self.max_health
+            health = self.health + hp_regen * dt
+            self.health = health if health < max_health else max_health
 
         # Stamina regeneration
-        self.stamina = min(self.stamina + self.stamina_regen * dt, self.max_stamina)
+        max_stamina = self.max_stamina
+        stamina = self.stamina + self.stamina_regen * dt
+        self.stamina = stamina if stamina < max_stamina else max_stamina
 
-        # Update rect for collision
-        self.rect.center = (int(self.position.x), int(self.position.y))
+        # Update rect for collision (direct x/y, no center tuple)
+        rect = self.rect
+        rect.x = int(x) - self._half_size
+        rect.y = int(y) - self._half_size
 
         if mouse_world_pos:
             # Calculate vector from player to mouse
-            delta_x = mouse_world_pos.x - self.position.x
-            delta_y = mouse_world_pos.y - self.position.y
+            delta_x = mouse_world_pos.x - x
+            delta_y = mouse_world_pos.y - y
 
             # Calculate angle (atan2 returns angle where 0° = East/Right)
             # Subtract 90° because sprite faces UP (North) by default
             angle_rad = math.atan2(delta_y, delta_x)
             self.angle = math.degrees(angle_rad) - 90 + 180
+            body_rad = math.radians(self.angle)
+            self.angle_cos = math.cos(body_rad)
+            self.angle_sin = math.sin(body_rad)
 
             # Rotate sprite (negative because pygame rotates counter-clockwise)
-            self.rendered_sprite = pygame.transform.rotate(
-                self.base_sprite, -self.angle
-            )
+            # One-degree cached rotations: no resampling per frame
+            self.rendered_sprite = get_rotated_surface(self.base_sprite, -self.angle)
+
+    def _move_walking(self, dt, dx, dy):
+        """
+        Normal movement step (input direction at speed x slow multiplier)
+
+        Args:
+            dt: Delta time in seconds
+            dx: X input direction
+            dy: Y input direction
+        """
+        if dx == 0 and dy == 0:
+            self.velocity.update(0, 0)
+            return
+
+        # Normalize diagonal movement
+        scale = self.speed * self.slow_multiplier / math.sqrt(dx * dx + dy * dy)
+        vx = dx * scale
+        vy = dy * scale
+        self.velocity.update(vx, vy)
+        position = self.position
+        position.update(position.x + vx * dt, position.y + vy * dt)
+
+    def _move_dashing(self, dt, dx, dy):
+        """
+        Dash movement step (locked direction, ignores input)
+
+        Args:
+            dt: Delta time in seconds
+            dx: X input direction (unused)
+            dy: Y input direction (unused)
+        """
+        dash_timer = self.dash_timer - dt
+        self.dash_timer = dash_timer
+
+        if dash_timer <= 0:
+            # Dash ended
+            self.is_dashing = False
+            self.invulnerable = False
+            self.dash_cooldown = self.dash_cooldown_time
+            self.velocity.update(0, 0)
+            self._move = self._move_walking
+            return
+
+        # Continue dash movement (velocity is fixed for the whole dash)
+        velocity = self.velocity
+        position = self.position
+        position.update(position.x + velocity.x * dt, position.y + velocity.y * dt)
 
     def set_weapon_target(self, target_pos):
         """Set weapon aim target (called from game_engine)"""
@@ -221,21 +302,19 @@ class Player(pygame.sprite.Sprite):
             angle_rad = math.atan2(delta_y, delta_x)
             self.weapon_angle = math.degrees(angle_rad)
             # Rotate weapon sprite
-            self.rendered_weapon = pygame.transform.rotate(
+            self.rendered_weapon = get_rotated_surface(
                 self.weapon_sprite, -self.weapon_angle
             )
 
     def _get_weapon_world_position(self):
         """Calculate weapon position in world coordinates"""
-        # Rotate weapon mount offset by player body angle
-        angle_rad = math.radians(self.angle)
-
-        rotated_x = self.weapon_mount_offset.x * math.cos(
-            angle_rad
-        ) - self.weapon_mount_offset.y * math.sin(angle_rad)
-        rotated_y = self.weapon_mount_offset.x * math.sin(
-            angle_rad
-        ) + self.weapon_mount_offset.y * math.cos(angle_rad)
+        # Rotate weapon mount offset by player body angle (cached cos/sin)
+        cos_a = self.angle_cos
+        sin_a = self.angle_sin
+        offset_x = self.weapon_mount_offset.x
+        offset_y = self.weapon_mount_offset.y
+        rotated_x = offset_x * cos_a - offset_y * sin_a
+        rotated_y = offset_x * sin_a + offset_y * cos_a
         return pygame.math.Vector2(
             self.position.x + rotated_x, self.position.y + rotated_y
         )
@@ -276,17 +355,26 @@ class Player(pygame.sprite.Sprite):
 
     def render(self, screen, camera):
         """Render player with all equipped weapons"""
+        # Player screen position, computed once for body and weapons
+        tx, ty = camera.get_translation()
+        sx = self.position.x + tx
+        sy = self.position.y + ty
+
         # Render player body
-        body_rect = self.rendered_sprite.get_rect(center=camera.apply(self.position))
+        body_rect = self.rendered_sprite.get_rect(center=(sx, sy))
         screen.blit(self.rendered_sprite, body_rect)
 
-        # Render all equipped weapons
+        # Render all equipped weapons (mounts rotated by the cached cos/sin)
+        cos_a = self.angle_cos
+        sin_a = self.angle_sin
         for slot in self.weapon_slots:
-            if not slot.is_empty() and slot.rendered_weapon:
-                weapon_pos = slot.get_world_position(self)
-                weapon_screen_pos = camera.apply(weapon_pos)
-                weapon_rect = slot.rendered_weapon.get_rect(center=weapon_screen_pos)
-                screen.blit(slot.rendered_weapon, weapon_rect)
+            rendered_weapon = slot.rendered_weapon
+            if slot.weapon is not None and rendered_weapon:
+                offset_x, offset_y = slot.mount_offset_xy(cos_a, sin_a)
+                weapon_rect = rendered_weapon.get_rect(
+                    center=(sx + offset_x, sy + offset_y)
+                )
+                screen.blit(rendered_weapon, weapon_rect)
         # Draw collision box (remove in production) 🔍
         """player_screen = camera.apply(self.position)
         pygame.draw.circle(
@@ -325,11 +413,12 @@ class Player(pygame.sprite.Sprite):
         self.is_dashing = True
         self.dash_timer = self.dash_duration
         self.invulnerable = True
+        self._move = self._move_dashing
 
-        # Normalize dash direction
-        self.dash_direction = pygame.math.Vector2(dx, dy)
-        if self.dash_direction.length() > 0:
-            self.dash_direction = self.dash_direction.normalize()
+        # Dash velocity along the normalized input (one sqrt, non-zero
+        # checked above); fixed for the whole dash, see _move_dashing
+        scale = self.dash_speed / math.sqrt(dx * dx + dy * dy)
+        self.velocity.update(dx * scale, dy * scale)
 
         return True
 
@@ -402,8 +491,10 @@ class Player(pygame.sprite.Sprite):
             return False
 
         # Calculate position
-        offset_x = random.randint(-10, 10)
-        offset_y = random.randint(-10, 10)
+        # One draw split into two uniform offsets in [-10, 10] (21 * 21 cells)
+        offset_x, offset_y = divmod(int(random.random() * 441), 21)
+        offset_x -= 10
+        offset_y -= 10
         bomb_x = self.position.x + offset_x
         bomb_y = self.position.y + offset_y
 
@@ -413,7 +504,7 @@ class Player(pygame.sprite.Sprite):
 
         # Decrease bomb count and start cooldown
         self.bomb_count -= 1
-        self.bomb_cooldown = BombConfig.PLACEMENT_COOLDOWN  # Start cooldown!
+        self.bomb_cooldown = self.bomb_placement_cooldown  # Start cooldown!
         logger.info(f"💣 Bomb placed! Remaining: {self.bomb_count}")
 
         return True
@@ -460,6 +551,9 @@ class Player(pygame.sprite.Sprite):
         for slot in self.weapon_slots:
             if slot.is_empty():
                 slot.equip_weapon(weapon, self.weapon_sprite)
+                weapon_type = type(weapon)
+                counts = self._weapon_type_counts
+                counts[weapon_type] = counts.get(weapon_type, 0) + 1
                 logger.info(f"⚔️ {weapon.get_name()} equipped to slot!")
                 return True
 
@@ -467,19 +561,18 @@ class Player(pygame.sprite.Sprite):
         return False
 
     def has_weapon_type(self, weapon_class):
-        """Check if player has any weapon of this type"""
+        """Check if player has any weapon of this type (type histogram)"""
         return any(
-            isinstance(slot.weapon, weapon_class)
-            for slot in self.weapon_slots
-            if not slot.is_empty()
+            issubclass(weapon_type, weapon_class)
+            for weapon_type in self._weapon_type_counts
         )
 
     def count_weapon_type(self, weapon_class):
-        """Count how many weapons of this type player has"""
+        """Count how many weapons of this type player has (type histogram)"""
         return sum(
-            1
-            for slot in self.weapon_slots
-            if not slot.is_empty() and isinstance(slot.weapon, weapon_class)
+            count
+            for weapon_type, count in self._weapon_type_counts.items()
+            if issubclass(weapon_type, weapon_class)
         )
 
     def get_empty_slot_count(self):
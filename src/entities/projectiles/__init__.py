@@ -1,18 +1,19 @@
 """
 Projectile Entities
-All projectile classes
+All projectile classes (loaded lazily)
 """
 
-from .base_projectile import BaseProjectile
-from .basic_projectile import BasicProjectile
-from .bomb_projectile import BombProjectile
-from .laser_projectile import LaserProjectile
-from .spread_projectile import SpreadProjectile
+from src.lazy_loader import lazy_exports
 
-__all__ = [
-    "BaseProjectile",
-    "BasicProjectile",
-    "BombProjectile",
-    "LaserProjectile",
-    "SpreadProjectile",
-]
+# Public name -> submodule (relative to this package) that defines it
+_LAZY = {
+    "BaseProjectile": ".base_projectile",
+    "BasicProjectile": ".basic_projectile",
+    "BombProjectile": ".bomb_projectile",
+    "LaserProjectile": ".laser_projectile",
+    "SpreadProjectile": ".spread_projectile",
+}
+
+__all__ = list(_LAZY)
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
@@ -10,6 +10,34 @@ from abc import ABC, abstractmethod
 class BaseProjectile(pygame.sprite.Sprite, ABC):
     """Base class for all projectiles"""
 
+    # Hot per-instance state in slots (Sprite still provides a __dict__
+    # for the extra attributes subclasses add)
+    __slots__ = (
+        "position",
+        "velocity",
+        "damage",
+        "speed",
+        "max_lifetime",
+        "age",
+        "radius",
+        "_rect",
+        "_half_w",
+        "_half_h",
+    )
+
+    # Set by subclasses whose _update_movement is position += velocity * dt
+    linear_motion = False
+    # True when the class is linear and keeps the base update (batch-steppable)
+    batch_movement = False
+
+    def __init_subclass__(cls, **kwargs):
+        """Flag linear subclasses that keep the base update() as batchable"""
+        super().__init_subclass__(**kwargs)
+        # New movement code drops an inherited linear_motion claim
+        if "_update_movement" in cls.__dict__ and "linear_motion" not in cls.__dict__:
+            cls.linear_motion = False
+        cls.batch_movement = cls.linear_motion and cls.update is BaseProjectile.update
+
     def __init__(self, x, y, damage, speed, lifetime=2.0):
         """
         Initialize base projectile
@@ -33,9 +61,27 @@ class BaseProjectile(pygame.sprite.Sprite, ABC):
         # Collision radius (set by subclass)
         self.radius = 0
 
-        # For sprite collision
+        # For sprite collision (synced from position only when read, see rect)
         self.rect = pygame.Rect(0, 0, 1, 1)
-        self.rect.center = (int(self.position.x), int(self.position.y))
+
+    @property
+    def rect(self):
+        """
+        Collision rect centred on the current position
+
+        Movement only writes position; the rect is brought up to date here
+        with direct x/y writes, so projectiles cost nothing per frame for it.
+        """
+        rect = self._rect
+        rect.x = int(self.position.x) - self._half_w
+        rect.y = int(self.position.y) - self._half_h
+        return rect
+
+    @rect.setter
+    def rect(self, value):
+        self._rect = value
+        self._half_w = value.w // 2
+        self._half_h = value.h // 2
 
     def update(self, dt):
         """
@@ -47,12 +93,9 @@ class BaseProjectile(pygame.sprite.Sprite, ABC):
         # Update age
         self.age += dt
 
-        # Update movement (implemented by subclass)
+        # Update movement (implemented by subclass; rect follows lazily)
         self._update_movement(dt)
 
-        # Update rect for collision
-        self.rect.center = (int(self.position.x), int(self.position.y))
-
     @abstractmethod
     def _update_movement(self, dt):
         """
@@ -77,8 +120,8 @@ class BaseProjectile(pygame.sprite.Sprite, ABC):
         Returns:
             bool: True if colliding
         """
-        distance = self.position.distance_to(entity.position)
-        return distance < (self.radius + entity.radius)
+        reach = self.radius + entity.radius
+        return self.position.distance_squared_to(entity.position) < reach * reach
 
     @abstractmethod
     def render(self, screen, camera):
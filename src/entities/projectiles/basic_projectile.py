@@ -3,14 +3,21 @@ Basic Projectile
 Standard yellow bullet projectile
 """
 
+import math
 import pygame
 from src.entities.projectiles.base_projectile import BaseProjectile
 from src.config import BasicWeaponConfig
+from src.rendering.surface_cache import blit_circle
 
 
 class BasicProjectile(BaseProjectile):
     """Basic yellow bullet projectile"""
 
+    __slots__ = ("color", "size")
+
+    # Straight-line flight (stepped in batch by step_projectiles)
+    linear_motion = True
+
     def __init__(
         self, x, y, target_pos, damage=None, speed=None, color=None, size=None
     ):
@@ -40,17 +47,20 @@ class BasicProjectile(BaseProjectile):
         self.size = size if size is not None else BasicWeaponConfig.PROJECTILE_SIZE
         self.radius = self.size // 2
 
-        # Calculate direction to target
-        direction = pygame.math.Vector2(target_pos.x - x, target_pos.y - y)
-        if direction.length() > 0:
-            direction = direction.normalize()
+        # Velocity towards target (one sqrt, zero when on target)
+        dx = target_pos.x - x
+        dy = target_pos.y - y
+        length_sq = dx * dx + dy * dy
+        if length_sq > 0:
+            scale = self.speed / math.sqrt(length_sq)
+            dx *= scale
+            dy *= scale
 
         # Movement velocity (straight line)
-        self.velocity = direction * self.speed
+        self.velocity = pygame.math.Vector2(dx, dy)
 
-        # Update rect size
+        # Update rect size (centred on position when read)
         self.rect = pygame.Rect(0, 0, self.size, self.size)
-        self.rect.center = (int(self.position.x), int(self.position.y))
 
     def _update_movement(self, dt):
         """
@@ -59,8 +69,10 @@ class BasicProjectile(BaseProjectile):
         Args:
             dt: Delta time in seconds
         """
-        # Simple straight-line movement
-        self.position += self.velocity * dt
+        # Simple straight-line movement (in place, no Vector2 temporary)
+        position = self.position
+        velocity = self.velocity
+        position.update(position.x + velocity.x * dt, position.y + velocity.y * dt)
 
     def render(self, screen, camera):
         """
@@ -70,9 +82,7 @@ class BasicProjectile(BaseProjectile):
             screen: Pygame surface to draw on
             camera: Camera object for world-to-screen conversion
         """
-        screen_pos = camera.apply(self.position)
+        sx, sy = camera.apply(self.position)
 
         # Draw projectile as a circle
-        pygame.draw.circle(
-            screen, self.color, (int(screen_pos.x), int(screen_pos.y)), self.radius
-        )
+        blit_circle(screen, self.color, (int(sx), int(sy)), self.radius)
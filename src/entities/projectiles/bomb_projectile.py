@@ -12,6 +12,16 @@ from src.config.weapons.bomb import BombConfig
 class BombProjectile(BaseProjectile):
     """Bomb projectile with delayed explosion"""
 
+    __slots__ = (
+        "explosion_radius",
+        "delay",
+        "timer",
+        "color",
+        "warning_color",
+        "pulse_speed",
+        "has_exploded",
+    )
+
     def __init__(self, x, y):
         """
         Initialize bomb projectile
@@ -44,9 +54,10 @@ class BombProjectile(BaseProjectile):
 
     def update(self, dt):
         """Update bomb timer"""
-        self.timer -= dt
+        timer = self.timer - dt
+        self.timer = timer
 
-        if self.timer <= 0 and not self.has_exploded:
+        if timer <= 0 and not self.has_exploded:
             self.has_exploded = True
 
     def _update_movement(self, dt):
@@ -63,27 +74,22 @@ class BombProjectile(BaseProjectile):
 
     def render(self, screen, camera):
         """Render bomb with pulsing warning circle"""
-        screen_pos = camera.apply(self.position)
+        sx, sy = camera.apply(self.position)
+        center = (int(sx), int(sy))
+        draw_circle = pygame.draw.circle
 
         # Draw bomb body
-        pygame.draw.circle(
-            screen, self.color, (int(screen_pos.x), int(screen_pos.y)), self.radius
-        )
+        draw_circle(screen, self.color, center, self.radius)
 
         # Draw pulsing warning circle
         pulse = math.sin(self.timer * 8) * 0.3 + 0.7
         warning_radius = int(self.explosion_radius * pulse)
 
-        # Draw warning circles
-        for i in range(3):
-            radius_offset = i * 5
-            pygame.draw.circle(
-                screen,
-                self.warning_color,
-                (int(screen_pos.x), int(screen_pos.y)),
-                warning_radius + radius_offset,
-                2,
-            )
+        # Draw warning circles (3 rings, 5px apart, unrolled)
+        warning_color = self.warning_color
+        draw_circle(screen, warning_color, center, warning_radius, 2)
+        draw_circle(screen, warning_color, center, warning_radius + 5, 2)
+        draw_circle(screen, warning_color, center, warning_radius + 10, 2)
 
     def get_explosion_data(self):
         print(f"💥 Explosion radius: {self.explosion_radius}px")
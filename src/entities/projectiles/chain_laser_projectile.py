@@ -72,8 +72,9 @@ class ChainLaserProjectile:
         if enemy is None or not enemy.alive():
             return False
 
-        distance = self.origin_pos.distance_to(enemy.position)
-        return distance <= ChainLaserConfig.RANGE
+        # Squared distance (no sqrt)
+        distance_sq = self.origin_pos.distance_squared_to(enemy.position)
+        return distance_sq <= ChainLaserConfig.RANGE_SQ
 
     def _update_chain_targets(self, enemies):
         """Find and update chain targets"""
@@ -102,15 +103,17 @@ class ChainLaserProjectile:
     def _find_nearest_unchained_enemy(self, from_enemy, enemies, exclude_set):
         """Find nearest enemy within chain range"""
         closest_enemy = None
-        closest_distance = ChainLaserConfig.CHAIN_RANGE
+        closest_distance_sq = ChainLaserConfig.CHAIN_RANGE_SQ
+        from_position = from_enemy.position
 
         for enemy in enemies:
             if enemy in exclude_set or not enemy.alive():
                 continue
 
-            distance = from_enemy.position.distance_to(enemy.position)
-            if distance < closest_distance:
-                closest_distance = distance
+            # Compare squared distances (same ordering, no sqrt)
+            distance_sq = from_position.distance_squared_to(enemy.position)
+            if distance_sq < closest_distance_sq:
+                closest_distance_sq = distance_sq
                 closest_enemy = enemy
 
         return closest_enemy
@@ -154,15 +157,15 @@ class ChainLaserProjectile:
     def render(self, screen, camera):
         """Render all beam segments"""
         for start_pos, end_pos in self.beam_segments:
-            screen_start = camera.apply(start_pos)
-            screen_end = camera.apply(end_pos)
+            screen_start_x, screen_start_y = camera.apply(start_pos)
+            screen_end_x, screen_end_y = camera.apply(end_pos)
 
             # Draw glow
             pygame.draw.line(
                 screen,
                 ChainLaserConfig.BEAM_GLOW_COLOR,
-                (int(screen_start.x), int(screen_start.y)),
-                (int(screen_end.x), int(screen_end.y)),
+                (int(screen_start_x), int(screen_start_y)),
+                (int(screen_end_x), int(screen_end_y)),
                 ChainLaserConfig.BEAM_GLOW_WIDTH,
             )
 
@@ -170,7 +173,7 @@ class ChainLaserProjectile:
             pygame.draw.line(
                 screen,
                 ChainLaserConfig.BEAM_COLOR,
-                (int(screen_start.x), int(screen_start.y)),
-                (int(screen_end.x), int(screen_end.y)),
+                (int(screen_start_x), int(screen_start_y)),
+                (int(screen_end_x), int(screen_end_y)),
                 ChainLaserConfig.BEAM_WIDTH,
             )
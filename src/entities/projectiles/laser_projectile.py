@@ -3,6 +3,7 @@ Laser Projectile
 Fast-moving beam projectile (configurable for different users)
 """
 
+import math
 import pygame
 from src.entities.projectiles.base_projectile import BaseProjectile
 
@@ -20,10 +21,15 @@ class LaserProjectile(BaseProjectile):
             target_position: Target position (Vector2) to aim at
             config: Laser config class (e.g., TankLaserConfig)
         """
-        # Calculate direction to target
-        direction = target_position - pygame.math.Vector2(x, y)
-        if direction.length() > 0:
-            direction = direction.normalize()
+        # Calculate direction to target (one sqrt, zero when on target)
+        dx = target_position.x - x
+        dy = target_position.y - y
+        length_sq = dx * dx + dy * dy
+        if length_sq > 0:
+            inv_length = 1.0 / math.sqrt(length_sq)
+            dx *= inv_length
+            dy *= inv_length
+        direction = pygame.math.Vector2(dx, dy)
 
         super().__init__(
             x,
@@ -65,45 +71,49 @@ class LaserProjectile(BaseProjectile):
 
     def _update_movement(self, dt):
         """Move laser forward"""
-        self.position += self.velocity * dt
-        self.rect.center = (int(self.position.x), int(self.position.y))
+        # In-place float update (no Vector2 temporary)
+        position = self.position
+        velocity = self.velocity
+        x = position.x + velocity.x * dt
+        y = position.y + velocity.y * dt
+        position.update(x, y)
 
     def collides_with(self, entity):
         """Check collision using laser beam line"""
         entity_pos = entity.position
         entity_radius = getattr(entity, "radius", 10)
 
-        distance = self._point_to_line_distance(
+        distance_sq = self._point_to_line_distance_sq(
             entity_pos, self.beam_start, self.beam_end
         )
 
-        return distance <= entity_radius
+        return distance_sq <= entity_radius * entity_radius
 
-    def _point_to_line_distance(self, point, line_start, line_end):
-        """Calculate shortest distance from point to line segment"""
+    def _point_to_line_distance_sq(self, point, line_start, line_end):
+        """Calculate squared shortest distance from point to line segment"""
         line_vec = line_end - line_start
         line_len_sq = line_vec.length_squared()
 
         if line_len_sq == 0:
-            return point.distance_to(line_start)
+            return point.distance_squared_to(line_start)
 
         point_vec = point - line_start
         t = max(0, min(1, point_vec.dot(line_vec) / line_len_sq))
         closest = line_start + (line_vec * t)
 
-        return point.distance_to(closest)
+        return point.distance_squared_to(closest)
 
     def render(self, screen, camera):
         """Render laser beam with glow effect"""
-        screen_start = camera.apply(self.beam_start)
-        screen_end = camera.apply(self.beam_end)
+        screen_start_x, screen_start_y = camera.apply(self.beam_start)
+        screen_end_x, screen_end_y = camera.apply(self.beam_end)
 
         # Draw outer glow
         pygame.draw.line(
             screen,
             self.glow_color,
-            (int(screen_start.x), int(screen_start.y)),
-            (int(screen_end.x), int(screen_end.y)),
+            (int(screen_start_x), int(screen_start_y)),
+            (int(screen_end_x), int(screen_end_y)),
             self.width + 2,
         )
 
@@ -111,7 +121,7 @@ class LaserProjectile(BaseProjectile):
         pygame.draw.line(
             screen,
             self.color,
-            (int(screen_start.x), int(screen_start.y)),
-            (int(screen_end.x), int(screen_end.y)),
+            (int(screen_start_x), int(screen_start_y)),
+            (int(screen_end_x), int(screen_end_y)),
             self.width,
         )
@@ -3,14 +3,17 @@ Spread Projectile
 Gold projectiles fired in spread pattern
 """
 
-import pygame
 from src.entities.projectiles.base_projectile import BaseProjectile
 from src.config.weapons.spread_weapon import SpreadWeaponConfig
+from src.rendering.surface_cache import blit_circle
 
 
 class SpreadProjectile(BaseProjectile):
     """Spread weapon projectile"""
 
+    # Straight-line flight (stepped in batch by step_projectiles)
+    linear_motion = True
+
     def __init__(self, x, y, direction):
         """
         Initialize spread projectile
@@ -39,8 +42,12 @@ class SpreadProjectile(BaseProjectile):
 
     def _update_movement(self, dt):
         """Move projectile in direction"""
-        self.position += self.velocity * dt
-        self.rect.center = (int(self.position.x), int(self.position.y))
+        # In-place float update (no Vector2 temporary)
+        position = self.position
+        velocity = self.velocity
+        x = position.x + velocity.x * dt
+        y = position.y + velocity.y * dt
+        position.update(x, y)
 
     def collides_with(self, entity):
         """
@@ -52,8 +59,8 @@ class SpreadProjectile(BaseProjectile):
         Returns:
             bool: True if colliding
         """
-        distance = self.position.distance_to(entity.position)
-        return distance < (self.radius + entity.radius)
+        reach = self.radius + entity.radius
+        return self.position.distance_squared_to(entity.position) < reach * reach
 
     def render(self, screen, camera):
         """
@@ -63,17 +70,10 @@ class SpreadProjectile(BaseProjectile):
             screen: Pygame surface
             camera: Camera for position conversion
         """
-        screen_pos = camera.apply(self.position)
+        sx, sy = camera.apply(self.position)
 
         # Draw outer glow (larger, lighter)
-        pygame.draw.circle(
-            screen,
-            self.glow_color,
-            (int(screen_pos.x), int(screen_pos.y)),
-            self.radius + 2,
-        )
+        blit_circle(screen, self.glow_color, (int(sx), int(sy)), self.radius + 2)
 
         # Draw inner projectile (smaller, brighter)
-        pygame.draw.circle(
-            screen, self.color, (int(screen_pos.x), int(screen_pos.y)), self.radius
-        )
+        blit_circle(screen, self.color, (int(sx), int(sy)), self.radius)
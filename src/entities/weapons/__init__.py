@@ -1,11 +1,18 @@
 """
 Weapon Entities
-All weapon classes
+All weapon classes (loaded lazily)
 """
 
-from .base_weapon import BaseWeapon
-from .basic_weapon import BasicWeapon
-from .spread_weapon import SpreadWeapon
-from .laser_weapon import LaserWeapon
+from src.lazy_loader import lazy_exports
 
-__all__ = ["BaseWeapon", "BasicWeapon", "SpreadWeapon", "LaserWeapon"]
+# Public name -> submodule (relative to this package) that defines it
+_LAZY = {
+    "BaseWeapon": ".base_weapon",
+    "BasicWeapon": ".basic_weapon",
+    "SpreadWeapon": ".spread_weapon",
+    "LaserWeapon": ".laser_weapon",
+}
+
+__all__ = list(_LAZY)
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
@@ -167,12 +167,18 @@ class BaseWeapon(ABC):
             Enemy or None: Closest enemy within range
         """
         closest_enemy = None
-        closest_distance = self.range
+        closest_distance_sq = self.range * self.range
 
+        # Squared distances on float locals (no sqrt / Vector2 call per enemy)
+        x = position.x
+        y = position.y
         for enemy in enemies:
-            distance = position.distance_to(enemy.position)
-            if distance < closest_distance:
-                closest_distance = distance
+            enemy_position = enemy.position
+            dx = enemy_position.x - x
+            dy = enemy_position.y - y
+            distance_sq = dx * dx + dy * dy
+            if distance_sq < closest_distance_sq:
+                closest_distance_sq = distance_sq
                 closest_enemy = enemy
 
         return closest_enemy
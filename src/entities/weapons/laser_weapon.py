@@ -104,7 +104,7 @@ class LaserWeapon(BaseWeapon):
             return None
 
         for enemy in self.all_enemies:
-            if enemy.position.distance_to(position) < 30:
+            if enemy.position.distance_squared_to(position) < 900:  # 30px
                 return enemy
         return None
 
@@ -114,15 +114,20 @@ class LaserWeapon(BaseWeapon):
             return None
 
         nearest_enemy = None
-        nearest_distance = max_range
+        nearest_distance_sq = max_range * max_range
 
+        x = position.x
+        y = position.y
         for enemy in self.all_enemies:
             if id(enemy) in exclude_ids:
                 continue
 
-            distance = position.distance_to(enemy.position)
-            if distance < nearest_distance:
-                nearest_distance = distance
+            enemy_position = enemy.position
+            dx = enemy_position.x - x
+            dy = enemy_position.y - y
+            distance_sq = dx * dx + dy * dy
+            if distance_sq < nearest_distance_sq:
+                nearest_distance_sq = distance_sq
                 nearest_enemy = enemy
 
         return nearest_enemy
@@ -42,12 +42,10 @@ class SpreadWeapon(BaseWeapon):
             target_pos: Vector2 position to fire toward (mouse)
             projectiles: Sprite group
         """
-        # Calculate base direction to target
-        base_direction = target_pos - weapon_tip
-        if base_direction.length() > 0:
-            base_direction = base_direction.normalize()
-
-        base_angle = math.atan2(base_direction.y, base_direction.x)
+        # Base angle to target (atan2 needs no normalized direction)
+        base_angle = math.atan2(
+            target_pos.y - weapon_tip.y, target_pos.x - weapon_tip.x
+        )
 
         # Fire spread projectiles
         half_spread = math.radians(SpreadWeaponConfig.SPREAD_ANGLE / 2)
@@ -93,14 +91,13 @@ class SpreadWeapon(BaseWeapon):
             mouse_world_pos: Mouse position in world coordinates
         """
         # Calculate direction to mouse
-        direction = mouse_world_pos - player.position
-        if direction.length() == 0:
+        dx = mouse_world_pos.x - player.position.x
+        dy = mouse_world_pos.y - player.position.y
+        if dx == 0 and dy == 0:
             return
 
-        direction = direction.normalize()
-
-        # Calculate base angle (direction to mouse)
-        base_angle = math.atan2(direction.y, direction.x)
+        # Calculate base angle (direction to mouse, no normalize needed)
+        base_angle = math.atan2(dy, dx)
 
         # Calculate spread angles
         projectile_count = SpreadWeaponConfig.PROJECTILE_COUNT
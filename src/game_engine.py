@@ -7,6 +7,7 @@ import pygame
 import math
 from src.config import WindowConfig, FastEnemyConfig
 from src.entities import Player
+from src.entities.enemies import Enemy
 from src.camera import Camera
 from src.logger import logger
 from src.systems import EnemySpawner, XPSystem, UpgradeSystem, PickupManager, WaveSystem
@@ -18,6 +19,8 @@ from src.rendering import GameRenderer
 from src.systems.effects import EffectManager
 from src.systems.input import InputHandler
 from src.systems.collision import CollisionManager
+from src.systems.enemy_steering import step_chasers
+from src.systems.projectile_steering import step_projectiles
 from src.game_event_handler import GameEventHandler
 from src.systems.events import get_event_bus, GameEvent
 from src.weapon_registry import register_all_weapons
@@ -32,6 +35,7 @@ class Game:
         self.running = True
         self.paused = True
         self.game_over = False
+        self.game_over_drawn = False  # Game over screen is static once presented
 
         # Game time tracking
         self.game_time = 0.0
@@ -206,9 +210,24 @@ class Game:
                 enemy_type_to_spawn, self.player.position, self.enemies
             )
 
-        # Update all enemies
+        # Update all enemies (plain chasers in one batch step)
+        Enemy.tick_animation(dt)
+        player_position = self.player.position
+        chasers = []
+        dead = []
         for enemy in self.enemies:
-            enemy.update(dt, self.player.position)
+            if enemy.is_dead:
+                dead.append(enemy)
+            elif enemy.batch_steering:
+                chasers.append(enemy)
+            else:
+                enemy.update(dt, player_position)
+        step_chasers(chasers, player_position.x, player_position.y, dt)
+
+        # Reap enemies killed outside collision handling (e.g. chain laser)
+        for enemy in dead:
+            self._handle_enemy_death(enemy)
+            self.wave_system.on_enemy_killed()
 
         # Check enemy shooting
         self._check_enemy_shooting()
@@ -216,19 +235,22 @@ class Game:
         # Check FastEnemy explosions
         self._check_fast_enemy_explosions()
 
-        # Update projectiles
-        for projectile in self.projectiles:
-            projectile.update(dt)
-        for projectile in self.enemy_projectiles:
-            projectile.update(dt)
+        # Update projectiles (straight-line ones in one batch)
+        movers = []
+        for group in (self.projectiles, self.enemy_projectiles):
+            for projectile in group:
+                if projectile.batch_movement:
+                    movers.append(projectile)
+                else:
+                    projectile.update(dt)
+        step_projectiles(movers, dt)
 
         # Update bombs
         for bomb in self.bombs:
             bomb.update(dt)
 
-        # Update all pickups (magnetic pull, animations)
-        for pickup in self.pickups:
-            pickup.update(dt, self.player)
+        # Update pickups near the player (magnetic pull, XP orbs in one batch)
+        self.pickup_manager.update_pickups(dt, self.player, self.pickups)
 
         # Check bomb explosions
         self._handle_collisions()
@@ -275,13 +297,14 @@ class Game:
         # Check game over
         if self.player.health <= 0:
             self.game_over = True
+            self.game_over_drawn = False
             logger.info("💀 GAME OVER!")
 
     def _check_enemy_shooting(self):
         """Check for enemies ready to shoot and spawn projectiles"""
         for enemy in self.enemies:
-            # Check if tank is ready to shoot
-            if hasattr(enemy, "should_shoot") and enemy.should_shoot():
+            # Check if tank is ready to shoot (flag defaults to False on Enemy)
+            if enemy.ready_to_shoot:
                 # Get shot data
                 shot_data = enemy.get_shot_data()
 
@@ -311,7 +334,6 @@ class Game:
             self.projectiles,
             self.enemy_projectiles,
             self.bombs,
-            self.pickups,
         )
 
         # ==================== PROJECTILE HITS ====================
@@ -403,8 +425,8 @@ class Game:
     def _check_fast_enemy_explosions(self):
         """Check for FastEnemy explosions and spawn radial lasers"""
         for enemy in list(self.enemies):
-            # Check if FastEnemy should explode
-            if hasattr(enemy, "should_explode") and enemy.should_explode():
+            # Check if FastEnemy should explode (flag defaults to False on Enemy)
+            if enemy.ready_to_explode:
                 explosion_pos = enemy.get_explosion_position()
 
                 # Explosion effect (smaller than bomb)
@@ -510,10 +532,19 @@ class Game:
         self.paused = False
 
     def render(self):
-        """Render game (delegates to renderer)"""
+        """
+        Render game (delegates to renderer)
+
+        Returns:
+            list or None: Dirty screen rects to present, None for the full frame
+        """
         if self.game_over:
+            # Static screen - nothing changes after the first presented frame
+            if self.game_over_drawn:
+                return []
             self.renderer.render_game_over(self)
-            return
+            self.game_over_drawn = True
+            return None
 
         # Always render game first
         self.renderer.render_game(self, self.camera, self.mouse_screen_pos)
@@ -525,8 +556,8 @@ class Game:
             else:
                 self.renderer.render_paused(self, self.camera)
 
-        # Single flip at the end
-        pygame.display.flip()
+        # Scrolling camera redraws the whole world - present the full frame
+        return None
 
     def restart(self):
         """Restart the game"""
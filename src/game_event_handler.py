@@ -75,7 +75,8 @@ class GameEventHandler:
 
     def _on_projectile_hit_effects(self, event):
         """Visual effects for projectile hit"""
-        direction = (event.enemy.position - event.projectile.position).normalize()
+        # Unnormalized is fine (only its angle is used) and safe at zero length
+        direction = event.enemy.position - event.projectile.position
         self.game.effect_manager.projectile_hit(event.position, direction)
 
     def _on_bomb_exploded_effects(self, event):
@@ -0,0 +1,40 @@
+"""
+Lazy Loader
+PEP 562 module __getattr__/__dir__ for packages that re-export classes
+"""
+
+import importlib
+import sys
+
+
+def lazy_exports(package_name, exports):
+    """
+    Build __getattr__ and __dir__ hooks that import exports on first access
+
+    Args:
+        package_name: The package's __name__
+        exports: {public name: relative submodule defining it}
+
+    Returns:
+        tuple: (__getattr__, __dir__) to assign at package level
+    """
+
+    def __getattr__(name):
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+        # Already-loaded submodules skip import_module (and its import lock)
+        module = sys.modules.get(package_name + module_name)
+        if module is None:
+            module = importlib.import_module(module_name, package_name)
+        value = getattr(module, name)
+
+        # Cache in the package so later lookups skip __getattr__
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package_name])) | set(exports))
+
+    return __getattr__, __dir__
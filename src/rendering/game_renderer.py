@@ -6,6 +6,8 @@ Separates rendering logic from game logic
 
 import pygame
 
+from src.config.common.colors import WHITE, RED, GREEN, YELLOW, GOLD
+from src.config.game import CULL_MARGIN
 from src.config.weapons.spread_weapon import SpreadWeaponConfig
 
 
@@ -28,10 +30,10 @@ class GameRenderer:
 
         # UI colors
         self.ui_bg_color = (40, 40, 40, 200)
-        self.ui_text_color = (255, 255, 255)
-        self.health_color = (255, 0, 0)
+        self.ui_text_color = WHITE
+        self.health_color = RED
         self.stamina_color = (0, 150, 255)
-        self.xp_color = (255, 215, 0)
+        self.xp_color = GOLD
 
         # Fonts
         self.font_small = pygame.font.Font(None, 20)
@@ -53,7 +55,7 @@ class GameRenderer:
 
         # Render in layers (bottom to top)
         self.render_background(game_state, camera)
-        self.render_pickups(game_state.pickups, camera)
+        self.render_pickups(game_state.pickup_manager.spatial_hash, camera)
         self.render_enemies(game_state.enemies, camera, game_state.player.position)
         self.render_player(game_state.player, camera)
         self.render_projectiles(game_state.projectiles, camera)
@@ -90,9 +92,14 @@ class GameRenderer:
         end_x = start_x + self.screen_width + grid_size
         end_y = start_y + self.screen_height + grid_size
 
+        # Reused world/screen vectors (no Vector2 allocation per line)
+        world_pos = pygame.math.Vector2(start_x, start_y)
+        screen_pos = pygame.math.Vector2()
+
         # Draw vertical lines
         for x in range(start_x, end_x, grid_size):
-            screen_pos = camera.apply(pygame.math.Vector2(x, start_y))
+            world_pos.x = x
+            camera.apply_into(world_pos, screen_pos)
             pygame.draw.line(
                 self.screen,
                 grid_color,
@@ -101,8 +108,10 @@ class GameRenderer:
             )
 
         # Draw horizontal lines
+        world_pos.x = start_x
         for y in range(start_y, end_y, grid_size):
-            screen_pos = camera.apply(pygame.math.Vector2(start_x, y))
+            world_pos.y = y
+            camera.apply_into(world_pos, screen_pos)
             pygame.draw.line(
                 self.screen,
                 grid_color,
@@ -110,30 +119,88 @@ class GameRenderer:
                 (self.screen_width, int(screen_pos.y)),
             )
 
-    def render_pickups(self, pickups, camera):
-        """Render all pickups"""
-        for pickup in pickups:
+    def render_pickups(self, pickup_hash, camera):
+        """
+        Render all on-screen pickups (cached bodies, one screen.blits())
+        Only pickups in cells under the view are visited, not every pickup
+
+        Args:
+            pickup_hash: PickupSpatialHash holding every live pickup
+            camera: Camera for world-to-screen conversion
+        """
+        tx, ty = camera.get_translation()
+        left, top, right, bottom = camera.get_cull_bounds(CULL_MARGIN)
+
+        pad = pickup_hash.max_radius
+        candidates = pickup_hash.query_rect(
+            left - pad, top - pad, right + pad, bottom + pad
+        )
 
-            pickup.render(self.screen, camera)
+        blit_seq = []
+        for pickup in candidates:
+            # Inlined AABB cull (no method call per pickup)
+            pos = pickup.position
+            x = pos.x
+            y = pos.y
+            r = pickup.radius
+            if left - r <= x <= right + r and top - r <= y <= bottom + r:
+                blit_seq.append(pickup.get_blit(x + tx, y + ty))
+
+        self.screen.blits(blit_seq, False)
 
     def render_enemies(self, enemies, camera, player_position):
-        """Render all enemies"""
+        """
+        Render all on-screen enemies
+        Base-render bodies go out in one screen.blits() call, then overlays
+        """
+        screen = self.screen
+        tx, ty = camera.get_translation()
+        left, top, right, bottom = camera.get_cull_bounds(CULL_MARGIN)
+
+        blit_seq = []
+        overlays = []
         for enemy in enemies:
-            enemy.render(self.screen, camera, player_position)
+            # Inlined AABB cull (no method call per enemy)
+            pos = enemy.position
+            x = pos.x
+            y = pos.y
+            r = enemy.radius
+            if not (left - r <= x <= right + r and top - r <= y <= bottom + r):
+                continue
+            if enemy.batch_render:
+                # Camera transform inlined (same as camera.apply, no call)
+                sx = x + tx
+                sy = y + ty
+                blit_seq.append(enemy.get_blit(sx, sy, player_position))
+                overlays.append((enemy, sx, sy))
+            else:
+                enemy.render(screen, camera, player_position)
+
+        screen.blits(blit_seq, False)
+        for enemy, sx, sy in overlays:
+            enemy.render_overlay(screen, sx, sy)
 
     def render_player(self, player, camera):
         """Render player"""
         player.render(self.screen, camera)
 
     def render_projectiles(self, projectiles, camera):
-        """Render all projectiles"""
+        """Render all on-screen projectiles"""
+        is_visible = camera.is_visible
+        margin = CULL_MARGIN
         for projectile in projectiles:
-            projectile.render(self.screen, camera)
+            pos = projectile.position
+            if is_visible(pos.x, pos.y, projectile.radius + margin):
+                projectile.render(self.screen, camera)
 
     def render_bombs(self, bombs, camera):
-        """Render all bombs"""
+        """Render all on-screen bombs (warning rings reach past the body)"""
+        is_visible = camera.is_visible
+        margin = CULL_MARGIN
         for bomb in bombs:
-            bomb.render(self.screen, camera)
+            pos = bomb.position
+            if is_visible(pos.x, pos.y, bomb.explosion_radius + margin):
+                bomb.render(self.screen, camera)
 
     def render_effects(self, game_state, camera):
         """
@@ -206,11 +273,11 @@ class GameRenderer:
         pygame.draw.rect(self.screen, self.health_color, (x, y, fill_width, bar_height))
 
         # Border
-        pygame.draw.rect(self.screen, (255, 255, 255), (x, y, bar_width, bar_height), 2)
+        pygame.draw.rect(self.screen, WHITE, (x, y, bar_width, bar_height), 2)
 
         # Text
         text = self.font.render(
-            f"HP: {int(player.health)}/{player.max_health}", True, (255, 255, 255)
+            f"HP: {int(player.health)}/{player.max_health}", True, WHITE
         )
         self.screen.blit(text, (x + 5, y + 2))
 
@@ -230,13 +297,13 @@ class GameRenderer:
         )
 
         # Border
-        pygame.draw.rect(self.screen, (255, 255, 255), (x, y, bar_width, bar_height), 2)
+        pygame.draw.rect(self.screen, WHITE, (x, y, bar_width, bar_height), 2)
 
         # Text
         text = self.font.render(
             f"SP: {int(player.stamina)}/{int(player.max_stamina)}",
             True,
-            (255, 255, 255),
+            WHITE,
         )
         self.screen.blit(text, (x + 5, y + 2))
 
@@ -254,13 +321,13 @@ class GameRenderer:
         pygame.draw.rect(self.screen, self.xp_color, (x, y, fill_width, bar_height))
 
         # Border
-        pygame.draw.rect(self.screen, (255, 255, 255), (x, y, bar_width, bar_height), 2)
+        pygame.draw.rect(self.screen, WHITE, (x, y, bar_width, bar_height), 2)
 
         # Text
         text = self.font.render(
             f"Level {xp_system.current_level}: {xp_system.current_xp}/{xp_system.xp_to_next_level} XP",
             True,
-            (255, 255, 255),
+            WHITE,
         )
         self.screen.blit(text, (x + 5, y + 2))
 
@@ -310,7 +377,7 @@ class GameRenderer:
 
         # Render stats
         for stat in stats:
-            text = self.font.render(stat, True, (255, 255, 255))
+            text = self.font.render(stat, True, WHITE)
             self.screen.blit(text, (x, y))
             y += 25
 
@@ -338,7 +405,7 @@ class GameRenderer:
 
         # Render debug text with background
         for i, line in enumerate(debug_lines):
-            text = self.font_small.render(line, True, (0, 255, 0))
+            text = self.font_small.render(line, True, GREEN)
 
             # Semi-transparent background
             bg_rect = pygame.Rect(x - 2, y + i * 22 - 2, text.get_width() + 4, 22)
@@ -370,7 +437,7 @@ class GameRenderer:
         self.screen.blit(overlay, (0, 0))
 
         # Pause text
-        text = self.font_huge.render("PAUSED", True, (255, 255, 255))
+        text = self.font_huge.render("PAUSED", True, WHITE)
         rect = text.get_rect(
             center=(self.screen_width // 2, self.screen_height // 2 - 50)
         )
@@ -421,7 +488,7 @@ class GameRenderer:
             stats.append(f"Level Reached: {game_state.xp_system.current_level}")
 
         for stat in stats:
-            text = self.font_large.render(stat, True, (255, 255, 255))
+            text = self.font_large.render(stat, True, WHITE)
             stat_rect = text.get_rect(
                 center=(self.screen_width // 2, self.screen_height // 2 + y_offset)
             )
@@ -437,8 +504,6 @@ class GameRenderer:
         )
         self.screen.blit(restart_text, restart_rect)
 
-        pygame.display.flip()
-
     def render_upgrade_menu(self, upgrade_menu):
         """
         Render upgrade menu overlay
@@ -494,18 +559,25 @@ class GameRenderer:
         )
 
     def render_enemy_projectiles(self, enemy_projectiles, camera):
-        """Render all enemy projectiles with different color"""
+        """Render all on-screen enemy projectiles with different color"""
+        is_visible = camera.is_visible
+        margin = CULL_MARGIN
         for projectile in enemy_projectiles:
+            # Lasers are centred on position and extend half their length
+            pos = projectile.position
+            if not is_visible(pos.x, pos.y, projectile.length / 2 + margin):
+                continue
+
             # Render with warning color (red/orange)
             projectile.render(self.screen, camera)
 
             # Optional: Add glow effect
             if hasattr(projectile, "position"):
-                screen_pos = camera.apply(projectile.position)
+                sx, sy = camera.apply(projectile.position)
                 pygame.draw.circle(
                     self.screen,
                     (255, 100, 100, 100),  # Red glow
-                    (int(screen_pos.x), int(screen_pos.y)),
+                    (int(sx), int(sy)),
                     8,
                     2,
                 )
@@ -527,6 +599,6 @@ class GameRenderer:
 
         y_offset = 200
         for line in debug_text:
-            text_surface = self.font.render(line, True, (255, 255, 0))
+            text_surface = self.font.render(line, True, YELLOW)
             self.screen.blit(text_surface, (10, y_offset))
             y_offset += 20
@@ -0,0 +1,79 @@
+"""
+Surface Cache
+Pre-rendered shapes shared by every entity of the same look
+"""
+
+import weakref
+import pygame
+
+# (color, radius) -> pre-rendered circle surface
+_circle_cache = {}
+
+
+def get_circle_surface(color, radius):
+    """
+    Get a cached surface with a filled circle (drawn once per color/radius)
+
+    Args:
+        color: RGB tuple
+        radius: Circle radius in pixels
+
+    Returns:
+        pygame.Surface: (2*radius x 2*radius) surface, circle centred
+    """
+    key = (color, radius)
+    surface = _circle_cache.get(key)
+    if surface is None:
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, color, (radius, radius), radius)
+
+        # Convert to display format for the fast blit path (needs a window)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+
+        _circle_cache[key] = surface
+    return surface
+
+
+def blit_circle(screen, color, center, radius):
+    """
+    Blit a cached filled circle (drop-in for pygame.draw.circle)
+
+    Args:
+        screen: Target surface
+        color: RGB tuple
+        center: (x, y) integer screen position
+        radius: Circle radius in pixels
+    """
+    screen.blit(
+        get_circle_surface(color, radius), (center[0] - radius, center[1] - radius)
+    )
+
+
+# source surface -> 360 one-degree rotations, filled on first use
+# (weak keys: entries go away with their source, e.g. on restart/re-equip)
+_rotation_cache = weakref.WeakKeyDictionary()
+
+
+def get_rotated_surface(surface, angle):
+    """
+    Get a cached rotation of a surface, snapped to the nearest whole degree
+    (drop-in for pygame.transform.rotate on long-lived sprites)
+
+    Args:
+        surface: Source surface (held weakly; use for loaded sprites and
+                 animation frames, not per-frame temporaries)
+        angle: Counter-clockwise rotation in degrees (pygame convention)
+
+    Returns:
+        pygame.Surface: Rotated surface (shared, do not draw on it)
+    """
+    lut = _rotation_cache.get(surface)
+    if lut is None:
+        lut = _rotation_cache[surface] = [None] * 360
+
+    index = int(angle % 360.0 + 0.5) % 360
+    rotated = lut[index]
+    if rotated is None:
+        rotated = lut[index] = pygame.transform.rotate(surface, index)
+    return rotated
@@ -1,18 +1,22 @@
 """
 Game Systems
 Core game systems (spawning, weapons, XP, upgrades, etc.)
+
+Loaded lazily like src.entities, so entity modules can import a single
+system (e.g. enemy_animation) without pulling in the enemy spawner.
 """
 
-from .enemy_spawner import EnemySpawner
-from .xp_system import XPSystem
-from .upgrade_system import UpgradeSystem
-from .pickups import PickupManager
-from .wave_system import WaveSystem
+from src.lazy_loader import lazy_exports
+
+# Public name -> submodule (relative to this package) that defines it
+_LAZY = {
+    "EnemySpawner": ".enemy_spawner",
+    "XPSystem": ".xp_system",
+    "UpgradeSystem": ".upgrade_system",
+    "PickupManager": ".pickups",
+    "WaveSystem": ".wave_system",
+}
+
+__all__ = list(_LAZY)
 
-__all__ = [
-    "EnemySpawner",
-    "XPSystem",
-    "UpgradeSystem",
-    "PickupManager",
-    "WaveSystem",
-]
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
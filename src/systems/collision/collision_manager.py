@@ -20,14 +20,21 @@ class CollisionManager:
         Args:
             cell_size: Size of spatial grid cells (default 100)
         """
+        # Broadphase hash of enemies (pickups live in PickupManager's
+        # persistent hash, so they are not re-hashed here every frame)
         self.grid = SpatialGrid(cell_size)
 
+        # Per-frame enemy snapshot as parallel arrays (structure-of-arrays)
+        self.enemy_list = []
+        self.enemy_xs = []
+        self.enemy_ys = []
+        self.enemy_radii = []
+
         # Collision results (populated after check_all)
         self.projectile_hits = []  # [(projectile, enemy)]
         self.enemy_projectile_hits = []  # [(projectile, player)]
         self.player_enemy_collisions = []  # [enemy]
         self.bomb_hits = []  # [(bomb, [enemies])]
-        self.pickup_collections = []  # [pickup]
 
     def clear_results(self):
         """Clear collision results from last frame"""
@@ -35,46 +42,36 @@ class CollisionManager:
         self.enemy_projectile_hits.clear()
         self.player_enemy_collisions.clear()
         self.bomb_hits.clear()
-        self.pickup_collections.clear()
 
-    def rebuild_grid(self, enemies, projectiles, enemy_projectiles, bombs, pickups):
+    def rebuild_grid(self, enemies, projectiles, enemy_projectiles, bombs):
         """
-        Rebuild spatial grid with all entities
+        Rebuild spatial grid after entities moved
         Call once per frame before collision checks
 
+        Only the entities that are looked up by position (enemies) are
+        hashed; projectiles, enemy projectiles and bombs are the ones
+        doing the querying, so indexing them would be wasted work.
+
         Args:
             enemies: List of enemy entities
-            projectiles: List of player projectiles
-            enemy_projectiles: List of enemy projectiles
-            bombs: List of bombs
-            pickups: List of pickups
+            projectiles: List of player projectiles (query side only)
+            enemy_projectiles: List of enemy projectiles (query side only)
+            bombs: List of bombs (query side only)
         """
         self.grid.clear()
 
-        # Add enemies to grid
+        # Add enemies to enemy grid
         for enemy in enemies:
             self.grid.add_entity(enemy)
 
-        # Add projectiles to grid
-        for projectile in projectiles:
-            self.grid.add_entity(projectile, radius=10)
-
-        # Add enemy projectiles to grid
-        for projectile in enemy_projectiles:
-            self.grid.add_entity(projectile, radius=10)
-
-        # Add bombs to grid (larger radius for explosion)
-        for bomb in bombs:
-            self.grid.add_entity(
-                bomb,
-                radius=(
-                    bomb.explosion_radius if hasattr(bomb, "explosion_radius") else 150
-                ),
-            )
-
-        # Add pickups to grid
-        for pickup in pickups:
-            self.grid.add_entity(pickup, radius=20)
+        # Snapshot enemy positions/radii once for batch narrow phases
+        enemy_list = list(enemies)
+        self.enemy_list = enemy_list
+        self.enemy_xs = [enemy.position.x for enemy in enemy_list]
+        self.enemy_ys = [enemy.position.y for enemy in enemy_list]
+        self.enemy_radii = [
+            getattr(enemy, "collision_radius", 20) for enemy in enemy_list
+        ]
 
     # ==================== PROJECTILE vs ENEMY ====================
 
@@ -91,29 +88,39 @@ class CollisionManager:
         """
         hits = []
 
+        # Broadphase via query_list: a plain list per projectile instead of
+        # get_nearby_entities' probes and set (an enemy spanning two cells
+        # may be tested twice, harmless with first-hit)
+        query = self.grid.query_list
+
         for projectile in projectiles:
-            # Get nearby enemies using spatial grid
-            nearby_enemies = self.grid.get_nearby_entities(projectile, radius=50)
+            position = projectile.position
+            px = position.x
+            py = position.y
 
-            # Filter to only enemies in the list
-            nearby_enemies = [e for e in nearby_enemies if e in enemies]
+            nearby_enemies = query(px, py, 50)
+            if not nearby_enemies:
+                continue
 
-            # Check exact collision
-            for enemy in nearby_enemies:
-                # Use projectile's collision check if available
-                if hasattr(projectile, "check_collision"):
-                    if projectile.check_collision(enemy):
+            # Use projectile's collision check if available (resolved once)
+            check_collision = getattr(projectile, "check_collision", None)
+            if check_collision is not None:
+                for enemy in nearby_enemies:
+                    if check_collision(enemy):
                         hits.append((projectile, enemy))
                         break  # Projectile can only hit one enemy
-                else:
-                    # Default circle collision
-                    distance = projectile.position.distance_to(enemy.position)
-                    proj_radius = getattr(projectile, "radius", 5)
-                    enemy_radius = getattr(enemy, "collision_radius", 20)
+                continue
 
-                    if distance < proj_radius + enemy_radius:
-                        hits.append((projectile, enemy))
-                        break
+            # Default circle collision (squared, projectile side hoisted)
+            proj_radius = getattr(projectile, "radius", 5)
+            for enemy in nearby_enemies:
+                reach = proj_radius + enemy.collision_radius
+                position = enemy.position
+                dx = position.x - px
+                dy = position.y - py
+                if dx * dx + dy * dy < reach * reach:
+                    hits.append((projectile, enemy))
+                    break  # Projectile can only hit one enemy
 
         return hits
 
@@ -135,12 +142,12 @@ class CollisionManager:
         # Get player collision radius
         player_radius = getattr(player, "collision_radius", 20)
 
+        player_position = player.position
         for projectile in enemy_projectiles:
-            # Check distance
-            distance = projectile.position.distance_to(player.position)
-            proj_radius = getattr(projectile, "radius", 5)
+            # Check distance (squared, no sqrt)
+            reach = getattr(projectile, "radius", 5) + player_radius
 
-            if distance < proj_radius + player_radius:
+            if projectile.position.distance_squared_to(player_position) < reach * reach:
                 hits.append(projectile)
 
         return hits
@@ -150,31 +157,28 @@ class CollisionManager:
     def check_player_enemy_collisions(self, player, enemies):
         """
         Check player colliding with enemies (contact damage)
+        Sweeps the enemy snapshot taken by rebuild_grid()
 
         Args:
             player: Player entity
-            enemies: List of enemies
+            enemies: List of enemies (same set passed to rebuild_grid)
 
         Returns:
             list: [enemy] list of enemies touching player
         """
-        collisions = []
-
-        # Get nearby enemies using spatial grid
         player_radius = getattr(player, "collision_radius", 20)
-        nearby_enemies = self.grid.get_nearby_entities(
-            player, radius=player_radius + 50
-        )
-
-        # Filter to only enemies in the list
-        nearby_enemies = [e for e in nearby_enemies if e in enemies]
-
-        # Check exact collision
-        for enemy in nearby_enemies:
-            distance = player.position.distance_to(enemy.position)
-            enemy_radius = getattr(enemy, "collision_radius", 20)
+        px = player.position.x
+        py = player.position.y
 
-            if distance < player_radius + enemy_radius:
+        # One sweep over the enemy arrays (squared distances, no Vector2 calls)
+        collisions = []
+        for enemy, x, y, enemy_radius in zip(
+            self.enemy_list, self.enemy_xs, self.enemy_ys, self.enemy_radii
+        ):
+            dx = x - px
+            dy = y - py
+            reach = player_radius + enemy_radius
+            if dx * dx + dy * dy < reach * reach:
                 collisions.append(enemy)
 
         return collisions
@@ -184,6 +188,7 @@ class CollisionManager:
     def check_bomb_explosions(self, bombs, enemies):
         """
         Check bombs that should explode and which enemies they hit
+        Sweeps the enemy snapshot taken by rebuild_grid()
 
         Args:
             bombs: List of bombs
@@ -202,19 +207,16 @@ class CollisionManager:
             # Get explosion radius
             explosion_radius = getattr(bomb, "explosion_radius", 150)
 
-            # Use grid to find nearby enemies
-            nearby_enemies = self.grid.get_nearby_entities(
-                bomb, radius=explosion_radius
-            )
-
-            # Filter to only enemies in the list
-            nearby_enemies = [e for e in nearby_enemies if e in enemies]
-
-            # Check exact distance
+            # One sweep over the enemy arrays (squared distances, each enemy
+            # once, so no set to dedupe grid cells)
+            radius_sq = explosion_radius * explosion_radius
+            bx = bomb.position.x
+            by = bomb.position.y
             hit_enemies = []
-            for enemy in nearby_enemies:
-                distance = bomb.position.distance_to(enemy.position)
-                if distance <= explosion_radius:
+            for enemy, x, y in zip(self.enemy_list, self.enemy_xs, self.enemy_ys):
+                dx = x - bx
+                dy = y - by
+                if dx * dx + dy * dy <= radius_sq:
                     hit_enemies.append(enemy)
 
             if hit_enemies:
@@ -222,41 +224,9 @@ class CollisionManager:
 
         return explosions
 
-    # ==================== PICKUP COLLECTION ====================
-
-    def check_pickup_collection(self, player, pickups, collection_radius=50):
-        """
-        Check pickups that player should collect
-
-        Args:
-            player: Player entity
-            pickups: List of pickups
-            collection_radius: Pickup collection radius
-
-        Returns:
-            list: [pickup] list of pickups to collect
-        """
-        collections = []
-
-        # Use grid to find nearby pickups
-        nearby_pickups = self.grid.get_nearby_entities(player, radius=collection_radius)
-
-        # Filter to only pickups in the list
-        nearby_pickups = [p for p in nearby_pickups if p in pickups]
-
-        # Check exact distance
-        for pickup in nearby_pickups:
-            distance = player.position.distance_to(pickup.position)
-            if distance <= collection_radius:
-                collections.append(pickup)
-
-        return collections
-
     # ==================== MASTER CHECK ====================
 
-    def check_all(
-        self, player, enemies, projectiles, enemy_projectiles, bombs, pickups
-    ):
+    def check_all(self, player, enemies, projectiles, enemy_projectiles, bombs):
         """
         Perform all collision checks in one call
         Results stored in class attributes
@@ -267,13 +237,12 @@ class CollisionManager:
             projectiles: List of player projectiles
             enemy_projectiles: List of enemy projectiles
             bombs: List of bombs
-            pickups: List of pickups
         """
         # Clear previous results
         self.clear_results()
 
         # Rebuild spatial grid
-        self.rebuild_grid(enemies, projectiles, enemy_projectiles, bombs, pickups)
+        self.rebuild_grid(enemies, projectiles, enemy_projectiles, bombs)
 
         # Run all collision checks
         self.projectile_hits = self.check_projectile_collisions(projectiles, enemies)
@@ -284,7 +253,6 @@ class CollisionManager:
             player, enemies
         )
         self.bomb_hits = self.check_bomb_explosions(bombs, enemies)
-        self.pickup_collections = self.check_pickup_collection(player, pickups)
 
     # ==================== RESULTS ACCESS ====================
 
@@ -304,10 +272,6 @@ class CollisionManager:
         """Get list of (bomb, [enemies]) that exploded"""
         return self.bomb_hits
 
-    def get_pickup_collections(self):
-        """Get list of pickups player collected"""
-        return self.pickup_collections
-
     # ==================== DEBUG ====================
 
     def get_debug_info(self):
@@ -321,5 +285,4 @@ class CollisionManager:
             "enemy_projectile_hits": len(self.enemy_projectile_hits),
             "player_collisions": len(self.player_enemy_collisions),
             "bomb_explosions": len(self.bomb_hits),
-            "pickups_collected": len(self.pickup_collections),
         }
@@ -124,6 +124,36 @@ class SpatialGrid:
 
         return nearby
 
+    def query_list(self, x, y, radius):
+        """
+        Get entities in the cells around a point as a plain list
+        (no set and no entity probing; an entity spanning several cells
+        can appear more than once)
+
+        Args:
+            x: World x of the query point
+            y: World y of the query point
+            radius: Search radius in pixels
+
+        Returns:
+            list: Entities from the covered cells (may contain duplicates)
+        """
+        cell_size = self.cell_size
+        min_x = int((x - radius) // cell_size)
+        max_x = int((x + radius) // cell_size)
+        min_y = int((y - radius) // cell_size)
+        max_y = int((y + radius) // cell_size)
+
+        grid = self.grid
+        nearby = []
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                bucket = grid.get((cell_x, cell_y))
+                if bucket:
+                    nearby.extend(bucket)
+
+        return nearby
+
     def get_entities_in_range(self, position, radius, entity_list=None):
         """
         Get entities within exact radius of position
@@ -144,11 +174,11 @@ class SpatialGrid:
         if entity_list is not None:
             nearby = nearby.intersection(set(entity_list))
 
-        # Exact distance check
+        # Exact distance check (squared, no sqrt)
+        radius_sq = radius * radius
         in_range = []
         for entity in nearby:
-            distance = entity.position.distance_to(position)
-            if distance <= radius:
+            if entity.position.distance_squared_to(position) <= radius_sq:
                 in_range.append(entity)
 
         return in_range
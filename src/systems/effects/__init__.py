@@ -6,6 +6,5 @@ Visual effects including particles and screen shake
 from .effect_manager import EffectManager
 from .particle_system import ParticleSystem
 from .screen_shake import ScreenShake
-from .particle import Particle
 
-__all__ = ["EffectManager", "ParticleSystem", "ScreenShake", "Particle"]
+__all__ = ["EffectManager", "ParticleSystem", "ScreenShake"]
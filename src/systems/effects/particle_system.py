@@ -5,24 +5,81 @@ Manages all particles in the game
 
 import random
 import math
-from .particle import Particle
+from .particle import draw_particle
+
+# Particle physics
+GRAVITY = 200.0  # Pixels per second^2
+DRAG = 0.98
 
 
 class ParticleSystem:
-    """Manages particle effects"""
+    """Manages particle effects (structure-of-arrays storage)"""
 
     def __init__(self):
         """Initialize particle system"""
-        self.particles = []
+        # Parallel lists, one slot per live particle
+        self.pos_x = []
+        self.pos_y = []
+        self.vel_x = []
+        self.vel_y = []
+        self.colors = []
+        self.sizes = []
+        self.ages = []
+        self.lifetimes = []
+
+    def _add(self, x, y, vx, vy, color, size, lifetime):
+        """Append one particle to the parallel arrays"""
+        self.pos_x.append(x)
+        self.pos_y.append(y)
+        self.vel_x.append(vx)
+        self.vel_y.append(vy)
+        self.colors.append(color)
+        self.sizes.append(size)
+        self.ages.append(0.0)
+        self.lifetimes.append(lifetime)
 
     def update(self, dt):
-        """Update all particles"""
-        self.particles = [p for p in self.particles if p.update(dt)]
+        """Update all particles and compact out the dead ones"""
+        pos_x, pos_y = self.pos_x, self.pos_y
+        vel_x, vel_y = self.vel_x, self.vel_y
+        colors, sizes = self.colors, self.sizes
+        ages, lifetimes = self.ages, self.lifetimes
+
+        gravity_step = GRAVITY * dt
+        alive = 0
+        for i in range(len(ages)):
+            age = ages[i] + dt
+            if age >= lifetimes[i]:
+                continue
+
+            vx = vel_x[i]
+            vy = vel_y[i]
+
+            # Apply velocity, then gravity, then drag
+            pos_x[alive] = pos_x[i] + vx * dt
+            pos_y[alive] = pos_y[i] + vy * dt
+            vel_x[alive] = vx * DRAG
+            vel_y[alive] = (vy + gravity_step) * DRAG
+            colors[alive] = colors[i]
+            sizes[alive] = sizes[i]
+            ages[alive] = age
+            lifetimes[alive] = lifetimes[i]
+            alive += 1
+
+        # Truncate all arrays to the survivors
+        for array in (pos_x, pos_y, vel_x, vel_y, colors, sizes, ages, lifetimes):
+            del array[alive:]
 
     def render(self, screen, camera):
-        """Render all particles"""
-        for particle in self.particles:
-            particle.render(screen, camera)
+        """Render all particles (positions projected in one batch)"""
+        if not self.ages:
+            return
+
+        screen_xs, screen_ys = camera.apply_batch(self.pos_x, self.pos_y)
+        for sx, sy, color, size, age, lifetime in zip(
+            screen_xs, screen_ys, self.colors, self.sizes, self.ages, self.lifetimes
+        ):
+            draw_particle(screen, sx, sy, color, size, age, lifetime)
 
     def emit_explosion(
         self, x, y, count=20, color=(255, 100, 0), speed=200, size=4, lifetime=0.8
@@ -57,7 +114,7 @@ class ParticleSystem:
             )
 
             # Create particle
-            particle = Particle(
+            self._add(
                 x,
                 y,
                 vx,
@@ -67,8 +124,6 @@ class ParticleSystem:
                 random.uniform(lifetime * 0.8, lifetime * 1.2),
             )
 
-            self.particles.append(particle)
-
     def emit_impact(self, x, y, direction, count=8, color=(255, 255, 100)):
         """
         Create impact/hit effect
@@ -79,26 +134,23 @@ class ParticleSystem:
             count: Number of particles
             color: RGB tuple
         """
-        # Normalize direction
-        if direction.length() > 0:
-            direction = direction.normalize()
+        # atan2 ignores length, so no normalize (and one atan2 per impact)
+        base_angle = math.atan2(direction.y, direction.x)
 
         for _ in range(count):
             # Spread around impact direction
             angle_offset = random.uniform(-math.pi / 3, math.pi / 3)
-            angle = math.atan2(direction.y, direction.x) + angle_offset
+            angle = base_angle + angle_offset
 
             speed = random.uniform(100, 300)
 
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
 
-            particle = Particle(
+            self._add(
                 x, y, vx, vy, color, random.uniform(2, 4), random.uniform(0.3, 0.6)
             )
 
-            self.particles.append(particle)
-
     def emit_death(self, x, y, enemy_color=(200, 50, 50)):
         """
         Create enemy death effect
@@ -135,16 +187,22 @@ class ParticleSystem:
         vx = -velocity.x * 0.3 + random.uniform(-20, 20)
         vy = -velocity.y * 0.3 + random.uniform(-20, 20)
 
-        particle = Particle(
-            x, y, vx, vy, color, random.uniform(2, 3), random.uniform(0.2, 0.4)
-        )
-
-        self.particles.append(particle)
+        self._add(x, y, vx, vy, color, random.uniform(2, 3), random.uniform(0.2, 0.4))
 
     def clear(self):
         """Clear all particles"""
-        self.particles.clear()
+        for array in (
+            self.pos_x,
+            self.pos_y,
+            self.vel_x,
+            self.vel_y,
+            self.colors,
+            self.sizes,
+            self.ages,
+            self.lifetimes,
+        ):
+            array.clear()
 
     def get_particle_count(self):
         """Get number of active particles"""
-        return len(self.particles)
+        return len(self.ages)
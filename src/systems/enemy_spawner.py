@@ -5,9 +5,13 @@ Handles spawning of enemies around the player
 
 import random
 import math
+from bisect import bisect_right
 from src.config import SpawnManagerConfig
 from src.entities.enemies import BasicEnemy, FastEnemy, TankEnemy, EliteEnemy
 
+# Enemy classes in the same order as SpawnManagerConfig.ENEMY_TYPE_CDF
+ENEMY_TYPE_CLASSES = (BasicEnemy, FastEnemy, TankEnemy, EliteEnemy)
+
 
 class EnemySpawner:
     """Manages enemy spawning"""
@@ -18,6 +22,10 @@ class EnemySpawner:
         self.difficulty_timer = 0.0
         self.difficulty_level = 0
 
+        # Warm sprite/rotation tables at load time, not on the first spawn
+        for enemy_class in ENEMY_TYPE_CLASSES:
+            enemy_class.preload_sprites()
+
     def update(self, dt, player_position, enemies):
         """
         Update spawner and spawn enemies
@@ -85,25 +93,9 @@ class EnemySpawner:
         Returns:
             Enemy instance
         """
-
-        roll = random.random()
-
-        if roll < SpawnManagerConfig.BASIC_ENEMY_CHANCE:
-            return BasicEnemy(x, y)
-        elif (
-            roll
-            < SpawnManagerConfig.BASIC_ENEMY_CHANCE
-            + SpawnManagerConfig.FAST_ENEMY_CHANCE
-        ):
-            return FastEnemy(x, y)
-        elif roll < (
-            SpawnManagerConfig.BASIC_ENEMY_CHANCE
-            + SpawnManagerConfig.FAST_ENEMY_CHANCE
-            + SpawnManagerConfig.TANK_ENEMY_CHANCE
-        ):
-            return TankEnemy(x, y)
-        else:
-            return EliteEnemy(x, y)
+        # One C-level bisect into the precomputed CDF (no sums per spawn)
+        index = bisect_right(SpawnManagerConfig.ENEMY_TYPE_CDF, random.random())
+        return ENEMY_TYPE_CLASSES[index](x, y)
 
     def spawn_enemy_by_type(self, enemy_type, player_position, enemies):
         """
@@ -0,0 +1,44 @@
+"""
+Enemy Steering
+Batch movement step for enemies that simply chase the player
+"""
+
+import math
+
+
+def step_chasers(enemies, target_x, target_y, dt):
+    """
+    Move enemies straight towards a target (animation frames are derived
+    from Enemy.animation_clock, so there is no per-enemy animation step)
+    One tight loop over plain floats (no Vector2 temporaries)
+
+    Args:
+        enemies: Iterable of live enemies using the base chase behaviour
+        target_x: Target world x (usually player position)
+        target_y: Target world y
+        dt: Delta time in seconds
+    """
+    sqrt = math.sqrt
+
+    for enemy in enemies:
+        position = enemy.position
+        x = position.x
+        y = position.y
+
+        # Direction to target scaled to speed (zero when on top of it)
+        dx = target_x - x
+        dy = target_y - y
+        dist_sq = dx * dx + dy * dy
+        if dist_sq > 0:
+            scale = enemy.speed / sqrt(dist_sq)
+            vx = dx * scale
+            vy = dy * scale
+        else:
+            vx = 0.0
+            vy = 0.0
+
+        # Move towards target
+        enemy.velocity.update(vx, vy)
+        x += vx * dt
+        y += vy * dt
+        position.update(x, y)  # rect syncs lazily from position
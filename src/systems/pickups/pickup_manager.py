@@ -5,7 +5,10 @@ Manages all pickups (XP orbs, health, powerups, etc.)
 
 import random
 from src.entities.pickups import XPOrb, HealthPickup, BombPickup
+from src.entities.pickups.base_pickup import BasePickup
+from src.systems.pickup_steering import step_xp_orbs
 from .drop_tables import DROP_TABLES, DEFAULT_DROP_TABLE
+from .pickup_spatial_hash import PickupSpatialHash
 
 
 class PickupManager:
@@ -13,7 +16,44 @@ class PickupManager:
 
     def __init__(self):
         """Initialize pickup manager"""
-        pass
+        # Every live pickup, by cell (player proximity queries stay local)
+        self.spatial_hash = PickupSpatialHash()
+
+    def _add_pickup(self, pickup, pickups):
+        """Add a new pickup to the sprite group and the spatial hash"""
+        pickups.add(pickup)
+        self.spatial_hash.insert(pickup)
+
+    def update_pickups(self, dt, player, pickups):
+        """
+        Update pickups near the player (magnetic pull) - resting pickups
+        elsewhere need no per-frame work, their pulse runs off the clock
+
+        Args:
+            dt: Delta time in seconds
+            player: Player entity
+            pickups: Sprite group of all pickups
+        """
+        BasePickup.tick_clock(dt)
+
+        player_x = player.position.x
+        player_y = player.position.y
+        chase_distance = player.xp_pickup_range * 2  # Chase at 2x pickup range
+
+        orbs = []
+        for pickup in self.spatial_hash.query(player_x, player_y, chase_distance):
+            if pickup.batch_steering:
+                orbs.append(pickup)
+            else:
+                pickup.update(dt, player)
+
+        if orbs:
+            step_xp_orbs(orbs, player_x, player_y, chase_distance, dt)
+
+            # Re-bucket orbs that were pulled into another cell
+            move = self.spatial_hash.move
+            for orb in orbs:
+                move(orb)
 
     def spawn_from_enemy(self, enemy, pickups):
         """
@@ -82,8 +122,8 @@ class PickupManager:
             xp_value: Amount of XP this orb gives
             pickups: Sprite group to add orb to
         """
-        xp_orb = XPOrb(x, y, xp_value)
-        pickups.add(xp_orb)
+        xp_orb = XPOrb.acquire(x, y, xp_value)
+        self._add_pickup(xp_orb, pickups)
 
     def spawn_health_pickup(self, x, y, heal_amount, pickups):
         """
@@ -95,8 +135,8 @@ class PickupManager:
             heal_amount: Amount of HP restored
             pickups: Sprite group to add pickup to
         """
-        health_pickup = HealthPickup(x, y, heal_amount)
-        pickups.add(health_pickup)
+        health_pickup = HealthPickup.acquire(x, y, heal_amount)
+        self._add_pickup(health_pickup, pickups)
 
     def collect_pickups(self, player, pickups):
         """
@@ -111,10 +151,24 @@ class PickupManager:
         """
         collected_xp = 0
 
-        for pickup in list(pickups):
+        # Player values hoisted out of the loop (squared distances, no sqrt)
+        player_x = player.position.x
+        player_y = player.position.y
+        player_radius = player.radius
+
+        # Only pickups in cells the player can reach (hash query is a copy)
+        spatial_hash = self.spatial_hash
+        nearby = spatial_hash.query(
+            player_x, player_y, player_radius + spatial_hash.max_radius
+        )
+
+        for pickup in nearby:
             # Use actual visual collision (pickup radius + player radius)
-            distance = pickup.position.distance_to(player.position)
-            if distance < (pickup.radius + player.radius):
+            position = pickup.position
+            dx = position.x - player_x
+            dy = position.y - player_y
+            reach = pickup.radius + player_radius
+            if dx * dx + dy * dy < reach * reach:
                 # Polymorphic collection! Each pickup type handles itself
                 value = pickup.on_collect(player)
 
@@ -124,6 +178,8 @@ class PickupManager:
 
                 # Remove pickup
                 pickups.remove(pickup)
+                spatial_hash.remove(pickup)
+                pickup.release()  # Recycled by the next spawn of this type
 
         return collected_xp
 
@@ -137,5 +193,5 @@ class PickupManager:
             bomb_amount: Number of bombs to give
             pickups: Sprite group to add pickup to
         """
-        bomb_pickup = BombPickup(x, y, bomb_amount)
-        pickups.add(bomb_pickup)
+        bomb_pickup = BombPickup.acquire(x, y, bomb_amount)
+        self._add_pickup(bomb_pickup, pickups)
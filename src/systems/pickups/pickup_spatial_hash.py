@@ -0,0 +1,141 @@
+"""
+Pickup Spatial Hash
+Persistent cell hash for pickups (they mostly sit still, so it is kept
+across frames and only touched on spawn, collect and orb movement)
+"""
+
+
+class PickupSpatialHash:
+    """
+    Pickups bucketed by grid cell for player proximity queries
+    Unlike SpatialGrid it is never rebuilt: O(1) insert/remove/move
+    """
+
+    def __init__(self, cell_size=64):
+        """
+        Initialize pickup hash
+
+        Args:
+            cell_size: Size of each grid cell in pixels
+        """
+        self.cell_size = cell_size
+        self.buckets = {}  # {(cell_x, cell_y): [pickups]}
+        self.cells = {}  # {pickup: (cell_x, cell_y)}
+        self.max_radius = 0  # Largest pickup radius seen (query padding)
+
+    def __len__(self):
+        """Number of hashed pickups"""
+        return len(self.cells)
+
+    def _get_cell(self, position):
+        """
+        Get cell coordinates for a position
+
+        Args:
+            position: pygame.math.Vector2
+
+        Returns:
+            tuple: (cell_x, cell_y)
+        """
+        cell_size = self.cell_size
+        return (int(position.x // cell_size), int(position.y // cell_size))
+
+    def insert(self, pickup):
+        """
+        Add a pickup to the hash
+
+        Args:
+            pickup: Pickup with position and radius
+        """
+        cell = self._get_cell(pickup.position)
+        self.cells[pickup] = cell
+        bucket = self.buckets.get(cell)
+        if bucket is None:
+            self.buckets[cell] = [pickup]
+        else:
+            bucket.append(pickup)
+
+        if pickup.radius > self.max_radius:
+            self.max_radius = pickup.radius
+
+    def remove(self, pickup):
+        """
+        Remove a pickup from the hash (no-op if not hashed)
+
+        Args:
+            pickup: Pickup to remove
+        """
+        cell = self.cells.pop(pickup, None)
+        if cell is None:
+            return
+
+        bucket = self.buckets[cell]
+        bucket.remove(pickup)
+        if not bucket:
+            del self.buckets[cell]
+
+    def move(self, pickup):
+        """
+        Re-bucket a pickup after its position changed
+
+        Args:
+            pickup: Hashed pickup that moved
+        """
+        cell = self._get_cell(pickup.position)
+        old_cell = self.cells[pickup]
+        if cell == old_cell:
+            return
+
+        bucket = self.buckets[old_cell]
+        bucket.remove(pickup)
+        if not bucket:
+            del self.buckets[old_cell]
+
+        self.cells[pickup] = cell
+        bucket = self.buckets.get(cell)
+        if bucket is None:
+            self.buckets[cell] = [pickup]
+        else:
+            bucket.append(pickup)
+
+    def query(self, x, y, radius):
+        """
+        Get pickups in the cells overlapping a circle's bounding box
+        (broadphase only - callers do the exact distance test)
+
+        Args:
+            x: World x of the circle centre
+            y: World y of the circle centre
+            radius: Search radius in pixels
+
+        Returns:
+            list: Candidate pickups
+        """
+        return self.query_rect(x - radius, y - radius, x + radius, y + radius)
+
+    def query_rect(self, left, top, right, bottom):
+        """
+        Get pickups in the cells overlapping a world-space rectangle
+        (broadphase only - callers do the exact bounds test)
+
+        Args:
+            left, top, right, bottom: Rectangle bounds in world pixels
+
+        Returns:
+            list: Candidate pickups
+        """
+        cell_size = self.cell_size
+        min_x = int(left // cell_size)
+        max_x = int(right // cell_size)
+        min_y = int(top // cell_size)
+        max_y = int(bottom // cell_size)
+
+        buckets = self.buckets
+        nearby = []
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                bucket = buckets.get((cell_x, cell_y))
+                if bucket:
+                    nearby.extend(bucket)
+
+        return nearby
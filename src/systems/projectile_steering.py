@@ -0,0 +1,21 @@
+"""
+Projectile Steering
+Batch movement step for projectiles that fly in a straight line
+"""
+
+
+def step_projectiles(projectiles, dt):
+    """
+    Age and move straight-line projectiles (the base update() inlined:
+    position += velocity * dt; the collision rect syncs lazily on read)
+
+    Args:
+        projectiles: Iterable of projectiles with batch_movement set
+        dt: Delta time in seconds
+    """
+    for projectile in projectiles:
+        projectile.age += dt
+
+        position = projectile.position
+        velocity = projectile.velocity
+        position.update(position.x + velocity.x * dt, position.y + velocity.y * dt)
@@ -4,6 +4,7 @@ Manages wave progression, enemy spawning, and difficulty scaling
 """
 
 import random
+from bisect import bisect_left
 from src.config.wave_system import WaveConfig
 from src.logger import logger
 
@@ -124,24 +125,14 @@ class WaveSystem:
         Returns:
             str: Enemy class name
         """
-        # Get composition for current wave (or closest lower wave)
-        composition = None
-        for wave_num in sorted(WaveConfig.WAVE_COMPOSITION.keys(), reverse=True):
-            if self.current_wave >= wave_num:
-                composition = WaveConfig.WAVE_COMPOSITION[wave_num]
-                break
-
-        if composition is None:
-            composition = WaveConfig.DEFAULT_COMPOSITION
-
-        # Random selection based on weights
-        rand = random.random()
-        cumulative = 0.0
-
-        for enemy_type, weight in composition.items():
-            cumulative += weight
-            if rand <= cumulative:
-                return enemy_type
+        # Precomputed composition for current wave (or closest lower wave)
+        table = WaveConfig.COMPOSITION_TABLE
+        types, cdf = table[min(self.current_wave, len(table) - 1)]
+
+        # Random selection based on weights (first cumulative >= roll)
+        index = bisect_left(cdf, random.random())
+        if index < len(types):
+            return types[index]
 
         # Fallback
         return "BasicEnemy"
@@ -6,6 +6,7 @@ Manages individual weapon slots with mount positions
 import pygame
 import math
 from src.logger import logger
+from src.rendering.surface_cache import get_rotated_surface
 
 
 class WeaponSlot:
@@ -65,6 +66,24 @@ class WeaponSlot:
         self.weapon_sprite = None
         self.rendered_weapon = None
 
+    def mount_offset_xy(self, cos_a, sin_a):
+        """
+        Rotate the mount offset by a body angle
+
+        Args:
+            cos_a: Cosine of the player body angle
+            sin_a: Sine of the player body angle
+
+        Returns:
+            tuple: (x, y) rotated offset from player center
+        """
+        offset_x = self.mount_offset.x
+        offset_y = self.mount_offset.y
+        return (
+            offset_x * cos_a - offset_y * sin_a,
+            offset_x * sin_a + offset_y * cos_a,
+        )
+
     def get_world_position(self, player):
         """
         Calculate world position of this weapon mount
@@ -75,31 +94,27 @@ class WeaponSlot:
         Returns:
             Vector2: World position of weapon mount
         """
-        angle_rad = math.radians(player.angle)
-
-        rotated_x = self.mount_offset.x * math.cos(
-            angle_rad
-        ) - self.mount_offset.y * math.sin(angle_rad)
-        rotated_y = self.mount_offset.x * math.sin(
-            angle_rad
-        ) + self.mount_offset.y * math.cos(angle_rad)
+        # Body angle cos/sin are cached on the player once per aim change
+        rotated_x, rotated_y = self.mount_offset_xy(player.angle_cos, player.angle_sin)
 
         return pygame.math.Vector2(
             player.position.x + rotated_x, player.position.y + rotated_y
         )
 
-    def get_weapon_tip_position(self, player, barrel_length=22):
+    def get_weapon_tip_position(self, player, barrel_length=22, mount_pos=None):
         """
         Calculate weapon tip position (where projectiles spawn)
 
         Args:
             player: Player entity
             barrel_length: Length of weapon barrel
+            mount_pos: Mount position already computed this frame (optional)
 
         Returns:
             Vector2: World position of weapon tip
         """
-        mount_pos = self.get_world_position(player)
+        if mount_pos is None:
+            mount_pos = self.get_world_position(player)
 
         weapon_angle_rad = math.radians(self.weapon_angle)
 
@@ -151,13 +166,12 @@ class WeaponSlot:
             if self.weapon_animation and self.weapon_animation.is_animating():
                 current_sprite = self.weapon_animation.get_current_frame()
 
-        # Rotate weapon sprite
-        self.rendered_weapon = pygame.transform.rotate(
-            current_sprite, -self.weapon_angle
-        )
+        # Rotate weapon sprite (cached per degree, frames are long-lived)
+        self.rendered_weapon = get_rotated_surface(current_sprite, -self.weapon_angle)
 
         # Update weapon with slot-specific weapon tip position
-        weapon_tip = self.get_weapon_tip_position(player)
+        # Reuse this frame's mount position (no second trig pass/Vector2)
+        weapon_tip = self.get_weapon_tip_position(player, mount_pos=mount_pos)
 
         # Track if weapon fired this frame
         # was_ready = self.weapon.cooldown_timer <= 0
@@ -204,12 +218,18 @@ class WeaponSlot:
             return None
 
         nearest_enemy = None
-        nearest_distance = float("inf")
+        nearest_distance_sq = float("inf")
 
+        # Squared distances on float locals (no sqrt / Vector2 call per enemy)
+        x = position.x
+        y = position.y
         for enemy in enemies:
-            distance = position.distance_to(enemy.position)
-            if distance < nearest_distance:
-                nearest_distance = distance
+            enemy_position = enemy.position
+            dx = enemy_position.x - x
+            dy = enemy_position.y - y
+            distance_sq = dx * dx + dy * dy
+            if distance_sq < nearest_distance_sq:
+                nearest_distance_sq = distance_sq
                 nearest_enemy = enemy
 
         return nearest_enemy.position if nearest_enemy else None